@@ -1,6 +1,31 @@
 from django.contrib import admin
 
-from .models import Booking, ContactMessage, Course, Exercise, Lesson
+from .exports import (
+    BOOKING_EXPORT_FIELDS,
+    CONTACT_EXPORT_FIELDS,
+    export_response,
+)
+from .models import (
+    Booking,
+    ContactMessage,
+    Course,
+    Exercise,
+    Job,
+    Lesson,
+    LessonScore,
+)
+from .search import filter_contact_messages
+
+
+def export_action(fields, name, fmt):
+    """Build an admin action that streams the selected rows."""
+
+    def action(modeladmin, request, queryset):
+        return export_response(queryset.order_by("id"), fields, name, fmt)
+
+    action.__name__ = f"export_{fmt}"
+    action.short_description = f"Export selected as {fmt.upper()}"
+    return action
 
 
 @admin.register(Lesson)
@@ -11,16 +36,35 @@ class LessonAdmin(admin.ModelAdmin):
 @admin.register(Exercise)
 class ExerciseAdmin(admin.ModelAdmin):
     list_display = ("lesson", "question")
+    # Exercise.__str__ and the lesson column read lesson.title
+    list_select_related = ("lesson",)
+
+
+@admin.register(LessonScore)
+class LessonScoreAdmin(admin.ModelAdmin):
+    list_display = ("user", "lesson", "correct", "attempts", "updated_at")
+    list_select_related = ("user", "lesson")
+    readonly_fields = ("user", "lesson", "correct", "attempts", "updated_at")
 
 
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
-    list_display = ("title", "start_date", "end_date", "capacity")
+    list_display = (
+        "title",
+        "start_date",
+        "end_date",
+        "capacity",
+        "active_bookings",
+    )
 
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
     list_display = ("user", "course", "name", "status", "created_at")
+    actions = [
+        export_action(BOOKING_EXPORT_FIELDS, "bookings", "csv"),
+        export_action(BOOKING_EXPORT_FIELDS, "bookings", "jsonl"),
+    ]
 
 
 @admin.register(ContactMessage)
@@ -30,3 +74,31 @@ class ContactMessageAdmin(admin.ModelAdmin):
     list_filter = ("created_at",)
     readonly_fields = ("name", "email", "subject", "message", "created_at")
     ordering = ("-created_at",)
+    actions = [
+        export_action(CONTACT_EXPORT_FIELDS, "contact-messages", "csv"),
+        export_action(CONTACT_EXPORT_FIELDS, "contact-messages", "jsonl"),
+    ]
+
+    def get_search_results(self, request, queryset, search_term):
+        """Use the full-text index instead of leading-wildcard scans."""
+        if search_term.strip():
+            matched = filter_contact_messages(queryset, search_term)
+            if matched is not None:
+                return matched, False
+        return super().get_search_results(request, queryset, search_term)
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "status", "attempts", "run_after")
+    list_filter = ("status", "kind")
+    readonly_fields = (
+        "kind",
+        "payload",
+        "status",
+        "attempts",
+        "last_error",
+        "run_after",
+        "claimed_at",
+        "created_at",
+    )
@@ -2,9 +2,22 @@ from django.apps import AppConfig
 
 
 class LanguagesConfig(AppConfig):
+    # Two AppConfig classes live here; mark which one Django should load
+    default = True
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'languages'
 
+    def ready(self):
+        from . import signals  # noqa: F401 (connects receivers)
+        from . import tasks  # noqa: F401 (registers job handlers)
+
+        from django.conf import settings
+
+        if settings.TEMPLATE_WARMUP:
+            from .warmup import warm_templates
+
+            warm_templates()
+
 
 class YourAppConfig(AppConfig): # Replace 'yourapp' with the actual name of your app
     name = 'yourapp'
@@ -0,0 +1,65 @@
+"""Versioned cache of the course catalog shown on booking pages."""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+from .models import Course
+from .routers import PRIMARY
+
+VERSION_KEY = "languages:catalog-version"
+
+
+def _catalog_key() -> str:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(VERSION_KEY, version, None)
+    return f"languages:catalog:{version}"
+
+
+def get_courses() -> list:
+    """
+    All courses as plain dicts, ordered by start date then title.
+    Served from cache until a course is saved or deleted.
+    """
+    key = _catalog_key()
+    courses = cache.get(key)
+    if courses is None:
+        # From the primary: a lagging replica would refill the cache
+        # with the catalog a write just invalidated
+        courses = list(
+            Course.objects.using(PRIMARY)
+            .order_by("start_date", "title")
+            .values(
+                "id", "title", "start_date", "end_date", "capacity"
+            )
+        )
+        cache.set(key, courses, settings.COURSE_CATALOG_TTL)
+    return courses
+
+
+def course_choices() -> list:
+    """(id, title) pairs for the booking form's course select."""
+    return [("", "---------")] + [
+        (course["id"], course["title"]) for course in get_courses()
+    ]
+
+
+def bump_catalog_version() -> None:
+    """
+    Point readers at a fresh cache key. Old entries are never read again
+    and simply expire, so no reader can see a half-updated catalog.
+    """
+    cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def cache_is_process_local() -> bool:
+    """
+    True when the default cache lives in this process's memory, so
+    invalidations made here (e.g. from a management command) never
+    reach the web workers; they see changes once their TTLs expire.
+    """
+    return isinstance(caches["default"], LocMemCache)
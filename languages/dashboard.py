@@ -0,0 +1,64 @@
+"""Precomputed admin dashboard aggregates, cached between writes."""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.utils import timezone
+
+from .models import Course
+from .routers import PRIMARY
+
+CACHE_KEY = "languages:dashboard-stats"
+
+
+def build_stats(today) -> dict:
+    """
+    Compute every dashboard aggregate from one grouped course query.
+    Returns plain data so the snapshot can live in any cache backend.
+    """
+    # From the primary, so a lagging replica can't cache stale numbers
+    courses = list(
+        Course.objects.using(PRIMARY)
+        .annotate(total_bookings=Count("bookings"))
+        .order_by()
+        .values(
+            "id",
+            "title",
+            "start_date",
+            "end_date",
+            "active_bookings",
+            "total_bookings",
+        )
+    )
+    booked = [c for c in courses if c["total_bookings"]]
+    active = [
+        c for c in courses
+        if c["total_bookings"] or c["start_date"] <= today <= c["end_date"]
+    ]
+    return {
+        "today": today,
+        "total_courses": len(courses),
+        "total_bookings": sum(c["total_bookings"] for c in courses),
+        # Active bookings for courses that have not started yet
+        "upcoming_bookings": sum(
+            c["active_bookings"] for c in courses
+            if c["start_date"] >= today
+        ),
+        "booked_courses": sorted(booked, key=lambda c: -c["id"]),
+        "active_courses": sorted(active, key=lambda c: c["title"]),
+    }
+
+
+def get_stats() -> dict:
+    """Return the cached snapshot, rebuilding it if stale or missing."""
+    today = timezone.now().date()
+    stats = cache.get(CACHE_KEY)
+    if stats is None or stats["today"] != today:
+        stats = build_stats(today)
+        cache.set(CACHE_KEY, stats, settings.DASHBOARD_STATS_TTL)
+    return stats
+
+
+def invalidate_stats() -> None:
+    """Drop the snapshot so the next dashboard load recomputes it."""
+    cache.delete(CACHE_KEY)
@@ -0,0 +1,46 @@
+"""
+Static files finder that only exposes runtime assets.
+
+STATICFILES_DIRS holds more than the site needs at runtime (project
+documentation screenshots, a Windows shortcut). This finder applies
+two lists of glob patterns from settings to those directories:
+
+- STATICFILES_EXCLUDE: files or directories never collected or served.
+  A bare name like ``documentation`` prunes that directory entirely.
+- STATICFILES_INCLUDE: if set, only matching files are used.
+
+Patterns match either a file's basename or its path relative to the
+static directory, as collectstatic's own --ignore patterns do. App
+static files (admin, allauth) go through AppDirectoriesFinder as before.
+"""
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import FileSystemFinder
+from django.contrib.staticfiles.utils import matches_patterns
+
+
+def _included(path: str) -> bool:
+    include = settings.STATICFILES_INCLUDE
+    return not include or matches_patterns(path, include)
+
+
+def _excluded(path: str) -> bool:
+    """True if ``path`` or any of its parent directories is excluded."""
+    parts = path.replace("\\", "/").split("/")
+    return any(
+        matches_patterns(part, settings.STATICFILES_EXCLUDE)
+        for part in parts
+    ) or matches_patterns(path, settings.STATICFILES_EXCLUDE)
+
+
+class RuntimeAssetsFinder(FileSystemFinder):
+    def find(self, path, find_all=False, **kwargs):
+        if _excluded(path) or not _included(path):
+            return [] if find_all else None
+        return super().find(path, find_all=find_all, **kwargs)
+
+    def list(self, ignore_patterns):
+        ignore = [*(ignore_patterns or ()), *settings.STATICFILES_EXCLUDE]
+        for path, storage in super().list(ignore):
+            if _included(path):
+                yield path, storage
@@ -1,8 +1,8 @@
 # languages/forms.py
 from django import forms
-from django.core.exceptions import ValidationError
 
-from .models import Booking, Course, ContactMessage
+from .catalog import course_choices
+from .models import Booking, ContactMessage
 
 
 def _display_name_for(user):
@@ -25,7 +25,8 @@ class BookingForm(forms.ModelForm):
     """
     Booking form for Booking model (no date/time fields).
     - Orders course dropdown by start_date then title
-    - Validates: a user cannot book the same course twice
+    - Duplicate bookings are rejected by the uniq_user_course
+      constraint when the booking service saves (no pre-check query)
     - For authenticated users: show name prefilled (not hidden)
     """
 
@@ -58,10 +59,9 @@ class BookingForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         self.user = user  # set by the view
 
-        # Populate and order the course select
-        self.fields["course"].queryset = Course.objects.order_by(
-            "start_date", "title"
-        )
+        # Course select comes from the cached catalog (ordered by
+        # start_date, title); the queryset is only hit to validate a POST
+        self.fields["course"].choices = course_choices()
         self.fields["course"].widget.attrs.update({"class": "form-select"})
 
         # Email is mandatory for everyone
@@ -75,19 +75,6 @@ class BookingForm(forms.ModelForm):
             if getattr(self.user, "email", "") and "email" not in self.initial:
                 self.initial["email"] = self.user.email
 
-    def clean(self):
-        cleaned = super().clean()
-        course = cleaned.get("course")
-
-        # Duplicate booking check (only if logged in and course selected)
-        if self.user and course:
-            qs = Booking.objects.filter(user=self.user, course=course)
-            if self.instance and self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-            if qs.exists():
-                raise ValidationError("You already booked this course.")
-        return cleaned
-
     def save(self, commit=True):
         """Ensure 'name' is set from logged-in user; email stays required."""
         booking = super().save(commit=False)
@@ -0,0 +1,102 @@
+"""
+Local background job queue backed by the Job table (no broker needed).
+
+Producers call enqueue(), which is a single INSERT. Workers started with
+``python manage.py run_jobs`` claim ready jobs in batches and hand each
+kind's batch to the handler registered with @handler(kind).
+"""
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+# A running job not finished within this window is assumed orphaned
+# (worker killed mid-batch) and becomes claimable again.
+LOCK_TIMEOUT = timedelta(minutes=5)
+
+HANDLERS = {}
+
+
+def handler(kind: str):
+    """Register ``func(jobs)`` to process batches of jobs of ``kind``."""
+
+    def register(func):
+        HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+def enqueue(kind: str, payload: dict) -> Job:
+    """Queue one job; constant time regardless of what the job does."""
+    return Job.objects.create(kind=kind, payload=payload)
+
+
+def claim(batch_size: int) -> list:
+    """
+    Atomically take up to ``batch_size`` ready jobs for this worker.
+    Rows locked by other workers are skipped where the DB supports it.
+    """
+    now = timezone.now()
+    ready = Q(status="queued", run_after__lte=now) | Q(
+        status="running", claimed_at__lt=now - LOCK_TIMEOUT
+    )
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(ready)
+            .order_by("id")[:batch_size]
+        )
+        for job in jobs:
+            job.status = "running"
+            job.claimed_at = now
+            job.attempts += 1
+        Job.objects.bulk_update(jobs, ["status", "claimed_at", "attempts"])
+    return jobs
+
+
+def _retry_or_fail(jobs, error: Exception) -> None:
+    now = timezone.now()
+    for job in jobs:
+        job.last_error = repr(error)
+        job.claimed_at = None
+        if job.attempts >= MAX_ATTEMPTS:
+            job.status = "failed"
+        else:
+            # Exponential backoff: 2, 4, 8, ... seconds
+            job.status = "queued"
+            job.run_after = now + timedelta(seconds=2 ** job.attempts)
+    Job.objects.bulk_update(
+        jobs, ["status", "run_after", "last_error", "claimed_at"]
+    )
+
+
+def run_batch(batch_size: int = 100) -> int:
+    """Claim and process one batch; returns how many jobs were taken."""
+    jobs = claim(batch_size)
+    by_kind = defaultdict(list)
+    for job in jobs:
+        by_kind[job.kind].append(job)
+
+    for kind, group in by_kind.items():
+        func = HANDLERS.get(kind)
+        try:
+            if func is None:
+                raise LookupError(f"No handler registered for {kind!r}")
+            with transaction.atomic():
+                func(group)
+        except Exception as exc:
+            logger.exception("Job batch %s failed", kind)
+            _retry_or_fail(group, exc)
+        else:
+            Job.objects.filter(pk__in=[job.pk for job in group]).delete()
+    return len(jobs)
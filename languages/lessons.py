@@ -0,0 +1,109 @@
+"""Lesson payloads for the (async) lesson API, cached per lesson version."""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from .models import Lesson
+from .quiz import shuffled_options
+
+
+async def lesson_version(lesson_id):
+    """updated_at of one lesson, or None if it does not exist."""
+    return await (
+        Lesson.objects.filter(pk=lesson_id)
+        .values_list("updated_at", flat=True)
+        .afirst()
+    )
+
+
+async def catalog_version():
+    """(lesson count, newest updated_at) for the lesson list."""
+    stats = await Lesson.objects.aaggregate(
+        total=Count("id"), newest=Max("updated_at")
+    )
+    return stats["total"], stats["newest"]
+
+
+def _exercise_payload(exercise) -> dict:
+    # Canonical order (correct answer first) is only ever cached;
+    # personalize_lesson() reorders it before it leaves the server.
+    return {
+        "id": exercise.id,
+        "question": exercise.question,
+        "options": [
+            exercise.correct_answer,
+            exercise.option_1,
+            exercise.option_2,
+            exercise.option_3,
+        ],
+    }
+
+
+async def build_lesson_payload(lesson_id):
+    """Lesson plus its exercises in two queries (prefetch_related)."""
+    lesson = await (
+        Lesson.objects.prefetch_related("exercises")
+        .filter(pk=lesson_id)
+        .afirst()
+    )
+    if lesson is None:
+        return None
+    return {
+        "id": lesson.id,
+        "title": lesson.title,
+        "description": lesson.description,
+        "content": lesson.content,
+        "updated_at": lesson.updated_at.isoformat(),
+        "exercises": [
+            _exercise_payload(exercise)
+            for exercise in lesson.exercises.all()
+        ],
+    }
+
+
+async def get_lesson_payload(lesson_id, version):
+    """
+    Cached lesson payload. The key includes ``version`` (updated_at), so
+    an edited lesson is simply a cache miss; nothing needs purging.
+    """
+    key = f"languages:lesson:{lesson_id}:{version.timestamp()}"
+    payload = await cache.aget(key)
+    if payload is None:
+        payload = await build_lesson_payload(lesson_id)
+        await cache.aset(key, payload, settings.LESSON_CACHE_TTL)
+    return payload
+
+
+def personalize_lesson(payload, user_id) -> dict:
+    """Copy of a cached payload with each exercise's options in the
+    learner's stable order (anonymous visitors share one order)."""
+    return {
+        **payload,
+        "exercises": [
+            {
+                **exercise,
+                "options": shuffled_options(
+                    exercise["options"], user_id, exercise["id"]
+                ),
+            }
+            for exercise in payload["exercises"]
+        ],
+    }
+
+
+async def lesson_list_payload() -> list:
+    """Summary of every lesson with its exercise count (one query)."""
+    rows = Lesson.objects.annotate(
+        exercise_count=Count("exercises")
+    ).values("id", "title", "description", "exercise_count", "updated_at")
+    return [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "description": row["description"],
+            "exercise_count": row["exercise_count"],
+            "updated_at": row["updated_at"].isoformat(),
+        }
+        async for row in rows
+    ]
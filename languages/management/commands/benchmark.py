@@ -0,0 +1,304 @@
+"""
+Micro-benchmarks for performance-sensitive code paths.
+
+Usage:
+    python manage.py benchmark                  # list scenarios
+    python manage.py benchmark ratelimit -n 20000
+    python manage.py benchmark startup -n 20
+    python manage.py benchmark queries
+    DB_POOL=true python manage.py benchmark db -n 2000 --concurrency 8
+    python manage.py benchmark http -n 2000 --concurrency 50 \
+        --url http://127.0.0.1:8000/lessons/
+
+Each scenario is a function registered with @scenario(name) that takes
+the command and the iteration count and writes its own report. Extra
+options are available to scenarios as ``command.options``.
+"""
+
+import statistics
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+SCENARIOS = {}
+
+
+def scenario(name: str):
+    """Register a benchmark scenario under ``name``."""
+
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+
+    return register
+
+
+def per_call_us(func, iterations: int) -> float:
+    """Average wall time of ``func()`` in microseconds."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+@scenario("ratelimit")
+def bench_ratelimit(command, iterations):
+    """Cost the contact limiter and dedup check add to one request."""
+    from django.conf import settings
+
+    from languages.ratelimit import allow, seen_before
+
+    run = uuid.uuid4().hex
+    backend = settings.CACHES[settings.RATELIMIT_CACHE]["BACKEND"]
+    # Distinct keys: every call is a fresh client under the limit
+    counter = iter(range(iterations * 3))
+    fresh = per_call_us(
+        lambda: allow(f"bench:{run}:{next(counter)}", 5, 600), iterations
+    )
+    # One hot key: the common "already counted, still allowed" path
+    hot = per_call_us(
+        lambda: allow(f"bench:{run}:hot", iterations * 2, 600), iterations
+    )
+    dedup = per_call_us(
+        lambda: seen_before(run, next(counter), "subject", "message",
+                            ttl=60),
+        iterations,
+    )
+    command.stdout.write(f"backend: {backend}")
+    command.stdout.write(f"allow() new key:  {fresh:8.2f} µs/call")
+    command.stdout.write(f"allow() hot key:  {hot:8.2f} µs/call")
+    command.stdout.write(f"seen_before():    {dedup:8.2f} µs/call")
+
+
+@scenario("startup")
+def bench_startup(command, iterations):
+    """First request after boot, with and without template warmup."""
+    from django.conf import settings
+    from django.template import engines
+    from django.test import Client
+
+    from languages.pagecache import purge
+    from languages.warmup import warm_templates
+
+    pages = ("/", "/english/", "/accounts/login/")
+    client = Client(HTTP_HOST=settings.ALLOWED_HOSTS[0])
+
+    def boot():
+        """Forget compiled templates and cached pages, as a new worker."""
+        for engine in engines.all():
+            for loader in getattr(engine, "engine", engine).template_loaders:
+                if hasattr(loader, "reset"):
+                    loader.reset()
+        purge()
+
+    def first_requests():
+        started = time.perf_counter()
+        for page in pages:
+            client.get(page, secure=True)
+        return (time.perf_counter() - started) * 1000
+
+    cold, warm, warmup = [], [], []
+    for _ in range(iterations):
+        boot()
+        cold.append(first_requests())
+        boot()
+        started = time.perf_counter()
+        warm_templates()
+        warmup.append((time.perf_counter() - started) * 1000)
+        warm.append(first_requests())
+
+    command.stdout.write(f"first request to {', '.join(pages)} (median ms)")
+    command.stdout.write(
+        f"cold loader:         {statistics.median(cold):8.2f}"
+    )
+    command.stdout.write(
+        f"after warmup:        {statistics.median(warm):8.2f}"
+    )
+    command.stdout.write(
+        f"warmup itself:       {statistics.median(warmup):8.2f} (at boot)"
+    )
+
+
+@scenario("db")
+def bench_db(command, iterations):
+    """Request latency from connection handling plus one small query."""
+    from django.core.signals import request_finished, request_started
+    from django.db import connection
+
+    from languages.models import Booking
+
+    def one_request(_=None):
+        # What the handler does around every request: close_old_connections
+        # runs on both signals; pool/CONN_MAX_AGE decide what "close" means
+        started = time.perf_counter()
+        request_started.send(sender=None)
+        try:
+            list(Booking.objects.filter(pk=0))
+        finally:
+            request_finished.send(sender=None)
+        return (time.perf_counter() - started) * 1e6
+
+    db = connection.settings_dict
+    pool_options = db.get("OPTIONS", {}).get("pool")
+    mode = (
+        f"pool {pool_options}"
+        if pool_options
+        else f"CONN_MAX_AGE={db['CONN_MAX_AGE']}"
+    )
+    concurrency = command.options["concurrency"]
+    one_request()  # first connect / pool start-up isn't a request cost
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = sorted(executor.map(one_request, range(iterations)))
+    quantiles = statistics.quantiles(samples, n=100)
+    command.stdout.write(f"{connection.vendor}, {mode}, threads={concurrency}")
+    command.stdout.write(
+        f"µs/request  p50 {quantiles[49]:.0f}  p95 {quantiles[94]:.0f}  "
+        f"p99 {quantiles[98]:.0f}  max {samples[-1]:.0f}"
+    )
+
+
+@scenario("queries")
+def bench_queries(command, iterations):
+    """DB queries per request in the booking and contact flows."""
+    from contextlib import ExitStack
+    from datetime import timedelta
+
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.db import connections
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+
+    from languages.models import Course, Job
+
+    run = uuid.uuid4().hex[:8]
+    today = timezone.now().date()
+    user = get_user_model().objects.create_user(
+        f"bench-{run}", f"bench-{run}@example.com", "unused"
+    )
+    course = Course.objects.create(
+        title=f"Query benchmark {run}",
+        capacity=5,
+        start_date=today + timedelta(days=7),
+        end_date=today + timedelta(days=37),
+    )
+    booking = {"course": course.pk, "name": "Bench", "email": "b@example.com"}
+    contact = {
+        "name": "Bench",
+        "email": "b@example.com",
+        "subject": f"Query benchmark {run}",
+        "message": "Counting queries.",
+    }
+    flows = {
+        "booking (logged in)": [
+            ("GET", "/book/", None),
+            ("POST", "/book/", booking),
+            ("GET", "/my-bookings/", None),
+        ],
+        "contact (anonymous)": [
+            ("GET", "/contact/", None),
+            ("POST", "/contact/", contact),
+            ("GET", "/contact/", None),
+        ],
+    }
+    command.stdout.write(
+        f"SESSION_ENGINE={settings.SESSION_ENGINE}\n"
+        f"MESSAGE_STORAGE={settings.MESSAGE_STORAGE}"
+    )
+    try:
+        for flow, steps in flows.items():
+            # A fresh client IP keeps the contact rate limit out of it
+            client = Client(
+                HTTP_HOST=settings.ALLOWED_HOSTS[0],
+                REMOTE_ADDR=f"198.51.100.{uuid.uuid4().int % 250 + 1}",
+            )
+            if flow.endswith("(logged in)"):
+                client.force_login(user)
+            command.stdout.write(flow)
+            for method, url, data in steps:
+                with ExitStack() as stack:
+                    captured = [
+                        stack.enter_context(CaptureQueriesContext(conn))
+                        for conn in connections.all()
+                    ]
+                    if method == "POST":
+                        response = client.post(url, data, secure=True)
+                    else:
+                        response = client.get(url, secure=True)
+                queries = sum(len(c.captured_queries) for c in captured)
+                command.stdout.write(
+                    f"  {method:4} {url:15} {response.status_code}  "
+                    f"{queries:3} queries"
+                )
+    finally:
+        Job.objects.filter(payload__subject=contact["subject"]).delete()
+        course.delete()
+        user.delete()
+
+
+@scenario("http")
+def bench_http(command, iterations):
+    """Concurrent GETs against a running server: throughput and latency."""
+    url = command.options["url"]
+    if not url:
+        raise CommandError("The http scenario needs --url.")
+
+    def fetch(_):
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as exc:
+            status = exc.code
+        except OSError:
+            status = None
+        return status, time.perf_counter() - started
+
+    concurrency = command.options["concurrency"]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(fetch, range(iterations)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(seconds * 1000 for _, seconds in results)
+    failures = sum(1 for status, _ in results if status != 200)
+    quantiles = statistics.quantiles(latencies, n=100)
+    command.stdout.write(f"{url}  concurrency={concurrency}")
+    command.stdout.write(
+        f"{iterations} requests in {elapsed:.2f}s: "
+        f"{iterations / elapsed:,.0f} req/s, {failures} non-200"
+    )
+    command.stdout.write(
+        f"latency ms  p50 {quantiles[49]:.1f}  p95 {quantiles[94]:.1f}  "
+        f"p99 {quantiles[98]:.1f}  max {latencies[-1]:.1f}"
+    )
+
+
+class Command(BaseCommand):
+    help = "Run a named micro-benchmark scenario."
+
+    def add_arguments(self, parser):
+        parser.add_argument("scenario", nargs="?")
+        parser.add_argument("-n", "--iterations", type=int, default=10000)
+        parser.add_argument("--url", help="Target for the http scenario.")
+        parser.add_argument("--concurrency", type=int, default=20)
+
+    def handle(self, *args, **options):
+        self.options = options
+        name = options["scenario"]
+        if not name:
+            for key in sorted(SCENARIOS):
+                doc = (SCENARIOS[key].__doc__ or "").strip()
+                self.stdout.write(f"{key:12} {doc}")
+            return
+        if name not in SCENARIOS:
+            raise CommandError(
+                f"Unknown scenario {name!r}; choose from {sorted(SCENARIOS)}"
+            )
+        SCENARIOS[name](self, options["iterations"])
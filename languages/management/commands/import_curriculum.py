@@ -0,0 +1,216 @@
+"""
+Bulk import lessons, exercises or courses from CSV or JSON Lines.
+
+Usage:
+    python manage.py import_curriculum lessons lessons.csv
+    python manage.py import_curriculum exercises exercises.jsonl
+    python manage.py import_curriculum courses courses.csv --batch-size 500
+
+Columns / keys per kind:
+    lessons:   title, content, description
+    exercises: lesson (lesson title), question, correct_answer,
+               option_1, option_2, option_3, explanation
+    courses:   title, capacity, start_date, end_date
+
+Files are streamed and written in batches with bulk_create(), so memory
+stays flat however large the file is. Lessons are matched by title and
+courses by (title, start_date); matches are updated in place through
+update_conflicts, everything else is inserted. Exercises are inserted,
+or updated when the row carries an ``id``. An exercise's lesson is
+resolved through an in-memory title -> id map, never a query per row.
+"""
+
+import csv
+import itertools
+import json
+import time
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from languages.catalog import bump_catalog_version, cache_is_process_local
+from languages.dashboard import invalidate_stats
+from languages.models import Course, Exercise, Lesson
+from languages.search import index_objects
+
+SPECS = {
+    "lessons": {
+        "model": Lesson,
+        "fields": ("title", "content", "description"),
+        "key": ("title",),
+    },
+    "exercises": {
+        "model": Exercise,
+        "fields": (
+            "lesson",
+            "question",
+            "correct_answer",
+            "option_1",
+            "option_2",
+            "option_3",
+            "explanation",
+        ),
+        "key": None,
+    },
+    "courses": {
+        "model": Course,
+        "fields": ("title", "capacity", "start_date", "end_date"),
+        "key": ("title", "start_date"),
+    },
+}
+
+
+def read_rows(path: Path, fmt: str):
+    """
+    Yield (line_number, row) from a CSV or JSONL file, lazily. CSV rows
+    are dicts; JSONL rows are the raw line, decoded per row by
+    _clean_row so one bad line is skipped rather than ending the import.
+    """
+    with path.open(newline="", encoding="utf-8") as handle:
+        if fmt == "csv":
+            for number, row in enumerate(csv.DictReader(handle), start=2):
+                yield number, row
+        else:
+            for number, line in enumerate(handle, start=1):
+                if line.strip():
+                    yield number, line
+
+
+class Command(BaseCommand):
+    help = "Stream a CSV/JSONL curriculum file into the database in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(SPECS))
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format",
+            choices=("csv", "jsonl"),
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not path.exists():
+            raise CommandError(f"No such file: {path}")
+        fmt = options["format"] or (
+            "csv" if path.suffix.lower() == ".csv" else "jsonl"
+        )
+        spec = SPECS[options["kind"]]
+        model = spec["model"]
+        fields = spec["fields"]
+        key = spec["key"]
+
+        # Natural key -> id for rows that already exist
+        existing = {}
+        if key:
+            for values in model.objects.values_list(*key, "id").iterator():
+                existing[values[:-1]] = values[-1]
+        lesson_ids = {}
+        if model is Exercise:
+            lesson_ids = dict(
+                Lesson.objects.values_list("title", "id").iterator()
+            )
+
+        model_fields = {f: model._meta.get_field(f) for f in fields}
+        update_fields = [f for f in fields if f not in (key or ())]
+        if model is Exercise:
+            update_fields[update_fields.index("lesson")] = "lesson_id"
+        if model is Lesson:
+            update_fields.append("updated_at")
+        touched_lessons = set()
+
+        created = updated = skipped = 0
+        started = time.perf_counter()
+        rows = read_rows(path, fmt)
+        for batch in itertools.batched(rows, options["batch_size"]):
+            objs = {}
+            for number, row in batch:
+                try:
+                    values = self._clean_row(row, model_fields, lesson_ids)
+                except (KeyError, ValueError, ValidationError) as exc:
+                    self.stderr.write(f"line {number}: skipped ({exc})")
+                    skipped += 1
+                    continue
+                obj = model(**values)
+                if key:
+                    natural = tuple(getattr(obj, f) for f in key)
+                    obj.pk = existing.get(natural)
+                    # Last row wins when a key repeats inside one batch
+                    objs[natural] = obj
+                else:
+                    objs[number] = obj
+
+            objs = list(objs.values())
+            updated_now = sum(1 for obj in objs if obj.pk)
+            with transaction.atomic():
+                model.objects.bulk_create(
+                    objs,
+                    update_conflicts=True,
+                    unique_fields=["id"],
+                    update_fields=update_fields,
+                )
+            # bulk_create sends no save signals, so index explicitly
+            index_objects(objs)
+            if model is Exercise:
+                touched_lessons.update(obj.lesson_id for obj in objs)
+            if key:
+                for obj in objs:
+                    if obj.pk:
+                        existing[tuple(getattr(obj, f) for f in key)] = obj.pk
+            updated += updated_now
+            created += len(objs) - updated_now
+
+        elapsed = time.perf_counter() - started
+        # bulk_create skips the save signals that refresh these caches
+        if model is Course:
+            bump_catalog_version()
+            invalidate_stats()
+        if touched_lessons:
+            Lesson.objects.filter(pk__in=touched_lessons).update(
+                updated_at=timezone.now()
+            )
+
+        if model is Course and cache_is_process_local():
+            self.stderr.write(
+                "CACHE_BACKEND is locmem: running web workers keep their "
+                "cached catalog/dashboard until the TTLs expire. Use "
+                "CACHE_BACKEND=file or db to refresh them immediately."
+            )
+
+        total = created + updated
+        rate = total / elapsed if elapsed else float(total)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{options['kind']}: {created} created, {updated} updated, "
+                f"{skipped} skipped in {elapsed:.2f}s ({rate:,.0f} rows/s)"
+            )
+        )
+
+    def _clean_row(self, row, model_fields, lesson_ids) -> dict:
+        """Convert one raw row to model field values."""
+        if isinstance(row, str):
+            row = json.loads(row)  # JSONDecodeError is a ValueError
+        if not isinstance(row, dict):
+            raise ValueError("expected a JSON object")
+        values = {}
+        if row.get("id"):
+            values["id"] = int(row["id"])
+        for name, field in model_fields.items():
+            raw = row.get(name)
+            if name == "lesson":
+                title = (raw or "").strip()
+                if title not in lesson_ids:
+                    raise KeyError(f"unknown lesson {title!r}")
+                values["lesson_id"] = lesson_ids[title]
+                continue
+            if raw is None or raw == "":
+                if field.has_default():
+                    continue
+                if field.blank:
+                    raw = ""
+            values[name] = field.clean(raw, None)
+        return values
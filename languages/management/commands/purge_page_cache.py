@@ -0,0 +1,27 @@
+"""
+Empty the anonymous full-page cache.
+
+Usage:
+    python manage.py purge_page_cache
+
+Run after a deploy that changes templates or static files. With
+PAGE_CACHE_BACKEND=file this clears the pages for every worker; the
+locmem backend lives inside each server process, so there a restart
+is what clears it and this command only affects its own process.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from languages.pagecache import purge
+
+
+class Command(BaseCommand):
+    help = "Drop every page stored by the anonymous page cache."
+
+    def handle(self, *args, **options):
+        purge()
+        backend = settings.CACHES[settings.PAGE_CACHE]["BACKEND"]
+        self.stdout.write(
+            self.style.SUCCESS(f"Page cache purged ({backend}).")
+        )
@@ -0,0 +1,43 @@
+"""
+Rebuild the search index from lessons, exercises and courses.
+
+Usage:
+    python manage.py rebuild_search_index
+
+Migration 0016 indexes what exists when it runs; use this after any
+bulk change made outside the ORM's save/delete signals.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from languages.models import Course, Exercise, Lesson, SearchDocument
+from languages.search import FTS_TABLE, index_objects
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Rebuild SearchDocument rows (and the full-text index)."
+
+    def handle(self, *args, **options):
+        total = 0
+        with transaction.atomic():
+            SearchDocument.objects.all().delete()
+            for model in (Lesson, Exercise, Course):
+                batch = []
+                for obj in model.objects.order_by().iterator(BATCH_SIZE):
+                    batch.append(obj)
+                    if len(batch) == BATCH_SIZE:
+                        index_objects(batch)
+                        total += len(batch)
+                        batch = []
+                index_objects(batch)
+                total += len(batch)
+            if connection.vendor == "sqlite":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) "
+                        f"VALUES ('rebuild')"
+                    )
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} objects."))
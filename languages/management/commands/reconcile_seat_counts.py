@@ -0,0 +1,57 @@
+"""
+Fix drift in Course.active_bookings.
+
+Usage:
+    python manage.py reconcile_seat_counts [--dry-run]
+
+Raw SQL, fixtures loaded with loaddata or an interrupted deploy can leave
+the counter out of step with the bookings table; this recounts it.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, Q
+
+from languages.catalog import cache_is_process_local
+from languages.models import Booking, Course
+
+
+class Command(BaseCommand):
+    help = "Recount Course.active_bookings from the bookings table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report courses whose counter has drifted.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = (
+            Course.objects.annotate(
+                actual=Count(
+                    "bookings",
+                    filter=Q(bookings__status__in=Booking.ACTIVE_STATUSES),
+                )
+            )
+            .exclude(active_bookings=F("actual"))
+            .values_list("pk", "title", "active_bookings", "actual")
+        )
+        rows = list(drifted)
+        for pk, title, stored, actual in rows:
+            self.stdout.write(
+                f"#{pk} {title}: stored={stored} actual={actual}"
+            )
+
+        if not rows:
+            self.stdout.write(self.style.SUCCESS("All seat counters match."))
+            return
+        if options["dry_run"]:
+            self.stdout.write(f"{len(rows)} course(s) drifted (dry run).")
+            return
+        Course.recount([pk for pk, *_ in rows])
+        if cache_is_process_local():
+            self.stderr.write(
+                "CACHE_BACKEND is locmem: running web workers keep their "
+                "cached dashboard until DASHBOARD_STATS_TTL expires."
+            )
+        self.stdout.write(self.style.SUCCESS(f"Fixed {len(rows)} course(s)."))
@@ -0,0 +1,48 @@
+"""
+Run background job workers for the local queue.
+
+Usage:
+    python manage.py run_jobs               # loop forever (Procfile worker)
+    python manage.py run_jobs --once        # drain the queue and exit
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from languages.jobs import run_batch
+
+
+class Command(BaseCommand):
+    help = "Process queued background jobs in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the queue is empty.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit as soon as the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        processed = 0
+        try:
+            while True:
+                close_old_connections()
+                taken = run_batch(options["batch_size"])
+                processed += taken
+                if taken:
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["sleep"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(f"Processed {processed} job(s).")
@@ -0,0 +1,131 @@
+"""
+Hammer one course with concurrent bookings and check the invariants.
+
+Usage:
+    python manage.py stress_bookings --threads 100 --capacity 10
+    python manage.py stress_bookings --threads 50 --same-user
+
+Creates a throwaway course and users, books from many threads at once
+through the booking service, verifies the outcome and cleans up.
+By default every thread is a different user and the course must never
+exceed its capacity. With --same-user every thread submits the same
+user's booking and exactly one may succeed.
+"""
+
+import threading
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from languages.models import Booking, Course
+from languages.services import (
+    AlreadyBookedError,
+    CourseFullError,
+    reserve_seat,
+)
+
+
+class Command(BaseCommand):
+    help = "Concurrent booking stress test for capacity and duplicates."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=50)
+        parser.add_argument("--capacity", type=int, default=5)
+        parser.add_argument(
+            "--same-user",
+            action="store_true",
+            help="Submit the same user's booking from every thread.",
+        )
+
+    def handle(self, *args, **options):
+        threads = options["threads"]
+        capacity = options["capacity"]
+        same_user = options["same_user"]
+        tag = uuid.uuid4().hex[:8]
+        today = timezone.now().date()
+
+        User = get_user_model()
+        course = Course.objects.create(
+            title=f"Stress test {tag}",
+            capacity=capacity,
+            start_date=today,
+            end_date=today + timedelta(days=30),
+        )
+        if same_user:
+            users = [User.objects.create(username=f"stress-{tag}-0")] * threads
+        else:
+            users = [
+                User.objects.create(username=f"stress-{tag}-{i}")
+                for i in range(threads)
+            ]
+
+        barrier = threading.Barrier(threads)
+        lock = threading.Lock()
+        results = {"booked": 0, "full": 0, "duplicate": 0, "errors": []}
+
+        def book(user):
+            try:
+                barrier.wait()
+                reserve_seat(
+                    Booking(
+                        user=user,
+                        course_id=course.pk,
+                        name=user.username,
+                        email=f"{user.username}@example.com",
+                    )
+                )
+                outcome = "booked"
+            except CourseFullError:
+                outcome = "full"
+            except AlreadyBookedError:
+                outcome = "duplicate"
+            except Exception as exc:  # report, don't hide, other failures
+                with lock:
+                    results["errors"].append(repr(exc))
+                return
+            finally:
+                connection.close()
+            with lock:
+                results[outcome] += 1
+
+        workers = [
+            threading.Thread(target=book, args=(user,)) for user in users
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            stored = course.bookings.filter(
+                status__in=Booking.ACTIVE_STATUSES
+            ).count()
+            course.refresh_from_db()
+            counter = course.active_bookings
+        finally:
+            course.delete()
+            User.objects.filter(username__startswith=f"stress-{tag}-").delete()
+
+        self.stdout.write(
+            f"threads={threads} capacity={capacity} same_user={same_user} "
+            f"booked={results['booked']} full={results['full']} "
+            f"duplicate={results['duplicate']} "
+            f"errors={len(results['errors'])} stored={stored} "
+            f"counter={counter}"
+        )
+        for error in results["errors"][:5]:
+            self.stderr.write(error)
+
+        expected = 1 if same_user else min(capacity, threads)
+        if stored > capacity:
+            raise CommandError(f"Overbooked: {stored} > {capacity}")
+        if results["errors"]:
+            raise CommandError("Some booking attempts failed unexpectedly.")
+        if stored != expected or results["booked"] != expected:
+            raise CommandError(f"Expected exactly {expected} booking(s).")
+        if counter != stored:
+            raise CommandError(f"Seat counter drifted: {counter} != {stored}")
+        self.stdout.write(self.style.SUCCESS("Invariants held."))
@@ -0,0 +1,28 @@
+"""
+Compile every project template and report failures.
+
+Usage:
+    python manage.py warm_templates
+
+Fills this process's cached template loader, so it mainly serves as a
+check that all templates parse (e.g. before a deploy). Web workers warm
+themselves at boot when TEMPLATE_WARMUP=true.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from languages.warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = "Pre-compile all project templates into the cached loader."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        compiled, failed = warm_templates()
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stdout.write(f"{compiled} templates compiled in {elapsed:.1f}ms")
+        if failed:
+            raise CommandError(f"Failed to compile: {', '.join(failed)}")
@@ -0,0 +1,61 @@
+"""Middleware for the languages app."""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from . import routers
+
+PIN_COOKIE = "primary_pin"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+
+class ReplicaPinMiddleware:
+    """
+    Route each request's reads (see languages.routers) and pin clients
+    that just wrote to the primary for REPLICA_PIN_SECONDS, so a booking
+    they made shows up on the next page even if the replica lags.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = routers.begin_request(self._pinned(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            state = routers.end_request(token)
+        return self._pin_writer(response, state)
+
+    async def __acall__(self, request):
+        token = routers.begin_request(self._pinned(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            state = routers.end_request(token)
+        return self._pin_writer(response, state)
+
+    def _pinned(self, request) -> bool:
+        return (
+            request.method not in SAFE_METHODS
+            or PIN_COOKIE in request.COOKIES
+        )
+
+    def _pin_writer(self, response, state):
+        if state.wrote and routers.REPLICA in settings.DATABASES:
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
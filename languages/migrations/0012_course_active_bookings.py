@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:18
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_active_bookings(apps, schema_editor):
+    Booking = apps.get_model("languages", "Booking")
+    Course = apps.get_model("languages", "Course")
+    active = (
+        Booking.objects.filter(
+            course=OuterRef("pk"),
+            status__in=("PENDING", "CONFIRMED"),
+        )
+        .order_by()
+        .values("course")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Course.objects.update(active_bookings=Coalesce(Subquery(active), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0010_alter_booking_email_alter_booking_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='active_bookings',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(
+            backfill_active_bookings,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name='contactmessage',
+            name='subject',
+            field=models.CharField(max_length=255),
+        ),
+    ]
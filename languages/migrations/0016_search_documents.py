@@ -0,0 +1,155 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:26
+
+from django.db import migrations, models
+from django.urls import reverse
+
+TABLE = "languages_searchdocument"
+FTS = "languages_searchdocument_fts"
+
+POSTGRES_FORWARD = [
+    f"""
+    ALTER TABLE {TABLE} ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ) STORED
+    """,
+    f"CREATE INDEX searchdocument_vector_gin ON {TABLE} "
+    f"USING GIN (search_vector)",
+]
+
+SQLITE_FORWARD = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS} USING fts5(
+        title, body,
+        content='{TABLE}', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS}(rowid, title, body)
+        VALUES (new.id, new.title, new.body);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS}_ad AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {FTS}({FTS}, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS}_au AFTER UPDATE ON {TABLE} BEGIN
+        INSERT INTO {FTS}({FTS}, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO {FTS}(rowid, title, body)
+        VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    f"DROP TRIGGER IF EXISTS {FTS}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS}_au",
+    f"DROP TABLE IF EXISTS {FTS}",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_fulltext_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == "sqlite":
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_fulltext_index(apps, schema_editor):
+    # On PostgreSQL the column and index go with the table
+    if schema_editor.connection.vendor == "sqlite":
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+def populate_search_documents(apps, schema_editor):
+    # Frozen copies of the builders in languages.search, on the
+    # historical models; the triggers above fill FTS5 as rows go in
+    db = schema_editor.connection.alias
+    Lesson = apps.get_model("languages", "Lesson")
+    Exercise = apps.get_model("languages", "Exercise")
+    Course = apps.get_model("languages", "Course")
+    SearchDocument = apps.get_model("languages", "SearchDocument")
+
+    def lesson_document(lesson):
+        return SearchDocument(
+            kind="lesson",
+            object_id=lesson.pk,
+            title=lesson.title,
+            body=f"{lesson.description}\n{lesson.content}",
+            url=reverse("lesson_detail", args=[lesson.pk]),
+        )
+
+    def exercise_document(exercise):
+        return SearchDocument(
+            kind="exercise",
+            object_id=exercise.pk,
+            title=exercise.question[:255],
+            body=f"{exercise.question}\n{exercise.explanation}",
+            url=reverse("lesson_detail", args=[exercise.lesson_id])
+            + f"#exercise-{exercise.pk}",
+        )
+
+    def course_document(course):
+        return SearchDocument(
+            kind="course",
+            object_id=course.pk,
+            title=course.title,
+            body="",
+            url=reverse("book_tutor") + f"?course={course.pk}",
+        )
+
+    for model, build in (
+        (Lesson, lesson_document),
+        (Exercise, exercise_document),
+        (Course, course_document),
+    ):
+        SearchDocument.objects.using(db).bulk_create(
+            (build(obj) for obj in model.objects.using(db).iterator(1000)),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('languages', '0015_exercise_attempts_lesson_scores'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('lesson', 'Lesson'), ('exercise', 'Exercise'), ('course', 'Course')], max_length=10)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('url', models.CharField(max_length=255)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='uniq_search_document')],
+            },
+        ),
+        migrations.RunPython(
+            create_fulltext_index,
+            reverse_code=drop_fulltext_index,
+        ),
+        migrations.RunPython(
+            populate_search_documents,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,151 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:28
+
+from django.db import migrations, models
+
+TABLE = "languages_contactmessage"
+FTS = "languages_contactmessage_fts"
+SEARCH_COLUMNS = ("name", "email", "subject", "message")
+
+# Trigram indexes on the exact expression Django emits for icontains,
+# UPPER(col::text) LIKE UPPER('%term%'), so admin search uses them.
+# Built CONCURRENTLY so the contact form keeps taking messages.
+POSTGRES_FORWARD = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+    f"CREATE INDEX CONCURRENTLY contact_{column}_trgm ON {TABLE} "
+    f"USING GIN ((UPPER({column}::text)) gin_trgm_ops)"
+    for column in SEARCH_COLUMNS
+]
+
+POSTGRES_BACKWARD = [
+    f"DROP INDEX CONCURRENTLY IF EXISTS contact_{column}_trgm"
+    for column in SEARCH_COLUMNS
+]
+
+CREATED_INDEX = models.Index(
+    fields=["created_at"], name="contact_created_idx"
+)
+
+SQLITE_FORWARD = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS} USING fts5(
+        name, email, subject, message,
+        content='{TABLE}', content_rowid='id',
+        tokenize='unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS}(rowid, name, email, subject, message)
+        VALUES (new.id, new.name, new.email, new.subject, new.message);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS}_ad AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {FTS}({FTS}, rowid, name, email, subject, message)
+        VALUES ('delete', old.id, old.name, old.email, old.subject,
+                old.message);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS}_au AFTER UPDATE ON {TABLE} BEGIN
+        INSERT INTO {FTS}({FTS}, rowid, name, email, subject, message)
+        VALUES ('delete', old.id, old.name, old.email, old.subject,
+                old.message);
+        INSERT INTO {FTS}(rowid, name, email, subject, message)
+        VALUES (new.id, new.name, new.email, new.subject, new.message);
+    END
+    """,
+    # Index messages that already exist
+    f"INSERT INTO {FTS}({FTS}) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    f"DROP TRIGGER IF EXISTS {FTS}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS}_au",
+    f"DROP TABLE IF EXISTS {FTS}",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def _concurrently(schema_editor) -> dict:
+    # Only PostgreSQL's schema editor can build an index without
+    # locking the table against writes
+    if schema_editor.connection.vendor == "postgresql":
+        return {"concurrently": True}
+    return {}
+
+
+def add_created_index(apps, schema_editor):
+    ContactMessage = apps.get_model("languages", "ContactMessage")
+    schema_editor.add_index(
+        ContactMessage, CREATED_INDEX, **_concurrently(schema_editor)
+    )
+
+
+def remove_created_index(apps, schema_editor):
+    ContactMessage = apps.get_model("languages", "ContactMessage")
+    schema_editor.remove_index(
+        ContactMessage, CREATED_INDEX, **_concurrently(schema_editor)
+    )
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_FORWARD)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        _run(schema_editor, POSTGRES_BACKWARD)
+
+
+def create_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('languages', '0016_search_documents'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='contactmessage',
+                    index=CREATED_INDEX,
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(
+                    add_created_index,
+                    reverse_code=remove_created_index,
+                ),
+            ],
+        ),
+        migrations.RunPython(
+            create_trigram_indexes,
+            reverse_code=drop_trigram_indexes,
+        ),
+        # The FTS5 table, its triggers and the initial rebuild go in
+        # together or not at all
+        migrations.RunPython(
+            create_fts_index,
+            reverse_code=drop_fts_index,
+            atomic=True,
+        ),
+    ]
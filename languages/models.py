@@ -2,10 +2,12 @@
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
-from django.db.models import Q
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 UserModel = get_user_model()
 
@@ -16,6 +18,8 @@ class Lesson(models.Model):
     title = models.CharField(max_length=100)
     content = models.TextField()
     description = models.TextField()
+    # Bumped on lesson saves and exercise changes; drives HTTP caching
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ("title",)
@@ -43,6 +47,71 @@ class Exercise(models.Model):
         return f"Exercise for {self.lesson.title}"
 
 
+class ExerciseAttempt(models.Model):
+    """One graded answer a learner gave to an exercise."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="exercise_attempts",
+    )
+    exercise = models.ForeignKey(
+        Exercise,
+        on_delete=models.CASCADE,
+        related_name="attempts",
+    )
+    answer = models.CharField(max_length=255)
+    is_correct = models.BooleanField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-created_at", "-id")
+        indexes = [
+            models.Index(
+                fields=["user", "exercise"],
+                name="attempt_user_exercise_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        verdict = "correct" if self.is_correct else "wrong"
+        return f"{self.user_id} → exercise {self.exercise_id} ({verdict})"
+
+
+class LessonScore(models.Model):
+    """Running per-user totals for a lesson, updated incrementally."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="lesson_scores",
+    )
+    lesson = models.ForeignKey(
+        Lesson,
+        on_delete=models.CASCADE,
+        related_name="scores",
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    correct = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "lesson"],
+                name="uniq_user_lesson_score",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} - {self.lesson}: {self.correct}/{self.attempts}"
+
+    @property
+    def accuracy(self) -> float:
+        """Share of attempts answered correctly (0.0 when none yet)."""
+        return self.correct / self.attempts if self.attempts else 0.0
+
+
 class Course(models.Model):
     """A course with capacity and schedule."""
 
@@ -50,6 +119,9 @@ class Course(models.Model):
     capacity = models.PositiveIntegerField(default=10)
     start_date = models.DateField()
     end_date = models.DateField()
+    # Denormalized count of PENDING/CONFIRMED bookings, kept in step by
+    # the Booking signals and BookingQuerySet (see reconcile_seat_counts)
+    active_bookings = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ("start_date", "title")
@@ -57,12 +129,37 @@ class Course(models.Model):
     def __str__(self) -> str:
         return self.title
 
+    @classmethod
+    def recount(cls, course_ids=None) -> int:
+        """
+        Recompute active_bookings from the bookings table.
+        Limited to ``course_ids`` when given; returns rows updated.
+        """
+        active = (
+            Booking.objects.filter(
+                course=OuterRef("pk"),
+                status__in=Booking.ACTIVE_STATUSES,
+            )
+            .order_by()
+            .values("course")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        courses = cls.objects.all()
+        if course_ids is not None:
+            courses = courses.filter(pk__in=course_ids)
+        from .dashboard import invalidate_stats  # avoid import cycle
+
+        updated = courses.update(
+            active_bookings=Coalesce(Subquery(active), 0)
+        )
+        invalidate_stats()
+        return updated
+
     @property
     def booked_count(self) -> int:
         """Number of seats currently booked or pending."""
-        return self.bookings.filter(
-            Q(status="CONFIRMED") | Q(status="PENDING")
-        ).count()
+        return self.active_bookings
 
     @property
     def seats_left(self) -> int:
@@ -70,6 +167,32 @@ class Course(models.Model):
         return max(self.capacity - self.booked_count, 0)
 
 
+class BookingQuerySet(models.QuerySet):
+    """
+    Queryset that keeps Course.active_bookings correct for bulk writes,
+    which bypass the per-instance save/delete signals.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        Course.recount({booking.course_id for booking in objs})
+        return objs
+
+    def update(self, **kwargs):
+        if not {"status", "course", "course_id"} & kwargs.keys():
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            course_ids = set(
+                self.order_by().values_list("course_id", flat=True)
+            )
+            rows = super().update(**kwargs)
+            target = kwargs.get("course_id", kwargs.get("course"))
+            if target is not None:
+                course_ids.add(getattr(target, "pk", target))
+            Course.recount(course_ids)
+        return rows
+
+
 class Booking(models.Model):
     """A user's booking for a course."""
 
@@ -78,6 +201,8 @@ class Booking(models.Model):
         ("CONFIRMED", "Confirmed"),
         ("CANCELLED", "Cancelled"),
     )
+    # Statuses that occupy a seat in the course
+    ACTIVE_STATUSES = ("PENDING", "CONFIRMED")
 
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -104,8 +229,25 @@ class Booking(models.Model):
         default="PENDING",
     )
 
+    objects = BookingQuerySet.as_manager()
+
+    # Course whose seat this row held when loaded or last saved
+    _held_seat = None
+
     class Meta:
         ordering = ("-created_at", "-id")
+        indexes = [
+            # Seat counts and per-course status filters
+            models.Index(
+                fields=["course", "status"],
+                name="booking_course_status_idx",
+            ),
+            # Newest-first feeds walk this index backwards
+            models.Index(
+                fields=["created_at", "id"],
+                name="booking_created_id_idx",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["user", "course"],
@@ -119,6 +261,20 @@ class Booking(models.Model):
             f"{self.created_at:%Y-%m-%d %H:%M}"
         )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if {"course_id", "status"} <= instance.__dict__.keys():
+            instance._held_seat = instance.seat_course_id
+        return instance
+
+    @property
+    def seat_course_id(self):
+        """Course this booking takes a seat in, or None if inactive."""
+        if self.status in self.ACTIVE_STATUSES:
+            return self.course_id
+        return None
+
 
 class Profile(models.Model):
     """User profile storing the (single) role."""
@@ -168,6 +324,83 @@ class ContactMessage(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Inbox ordering and the admin date filter
+            models.Index(fields=["created_at"], name="contact_created_idx"),
+        ]
 
     def __str__(self):
         return f"Message from {self.name} ({self.email})"
+
+
+class Job(models.Model):
+    """
+    A unit of background work in the local, database-backed queue.
+    Finished jobs are deleted; failed ones stay for inspection.
+    See languages.jobs and the run_jobs command.
+    """
+
+    STATUS_CHOICES = (
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("failed", "Failed"),
+    )
+
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default="queued",
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    run_after = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("id",)
+        indexes = [
+            models.Index(
+                fields=["status", "run_after"],
+                name="job_ready_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind} #{self.pk} [{self.status}]"
+
+
+class SearchDocument(models.Model):
+    """
+    Searchable text of one lesson, exercise or course.
+
+    Kept in step by signals (see languages.search). The full-text index
+    itself is backend-specific and created in migration 0016: a
+    generated tsvector column with a GIN index on PostgreSQL, an FTS5
+    table on SQLite.
+    """
+
+    KIND_CHOICES = (
+        ("lesson", "Lesson"),
+        ("exercise", "Exercise"),
+        ("course", "Course"),
+    )
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    url = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"],
+                name="uniq_search_document",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.object_id} {self.title}"
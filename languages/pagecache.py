@@ -0,0 +1,134 @@
+"""
+Full-page cache for public pages, served to anonymous visitors only.
+
+Rendered HTML is kept in the cache alias named by settings.PAGE_CACHE
+(local memory or file backend, chosen in settings) for PAGE_CACHE_TTL
+seconds. A request is only served from, or stored in, the cache when:
+
+- it is a GET/HEAD without a session or messages cookie, so there is no
+  logged-in user and no flash message to show;
+- the view queued no messages and asked for no CSRF token, so the page
+  holds nothing specific to this visitor;
+- the response is a plain 200/404 that sets no cookies.
+
+Cached responses carry ``Vary: Cookie`` so shared HTTP caches keep
+anonymous and logged-in copies apart. ``manage.py purge_page_cache``
+empties the cache, e.g. after a deploy.
+"""
+
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+CACHEABLE_STATUSES = (200, 404)
+
+
+def _cache():
+    return caches[settings.PAGE_CACHE]
+
+
+def _cache_key(name: str, path: str | None) -> str:
+    key = f"languages:page:{name}"
+    if path is not None:
+        key += ":" + hashlib.md5(path.encode()).hexdigest()
+    return key
+
+
+def _is_anonymous(request) -> bool:
+    """Cheap check that needs neither the session nor the user."""
+    return (
+        request.method in ("GET", "HEAD")
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and CookieStorage.cookie_name not in request.COOKIES
+    )
+
+
+def _is_shareable(request, response) -> bool:
+    """True if ``response`` holds nothing specific to this visitor."""
+    return (
+        response.status_code in CACHEABLE_STATUSES
+        and not response.streaming
+        and not response.cookies
+        and not response.has_header("Vary")
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        and not len(messages.get_messages(request))
+    )
+
+
+def _replay(entry) -> HttpResponse:
+    content, status, content_type = entry
+    response = HttpResponse(content, status=status, content_type=content_type)
+    patch_vary_headers(response, ("Cookie",))
+    return response
+
+
+def _entry(response) -> tuple:
+    """Picklable (content, status, content type) for the cache."""
+    if hasattr(response, "render"):
+        response.render()
+    patch_vary_headers(response, ("Cookie",))
+    return response.content, response.status_code, response["Content-Type"]
+
+
+def cache_public_page(name: str, per_path: bool = True):
+    """
+    Cache a view's rendered page for anonymous visitors under ``name``.
+
+    With ``per_path=False`` one copy serves every URL, which suits
+    pages like the 404 that don't depend on the path and must not let
+    random URLs fill the cache. Works on sync and async views.
+    """
+
+    def decorator(view):
+        def key_for(request):
+            return _cache_key(name, request.path if per_path else None)
+
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def wrapper(request, *args, **kwargs):
+                if not _is_anonymous(request):
+                    return await view(request, *args, **kwargs)
+                key = key_for(request)
+                entry = await _cache().aget(key)
+                if entry is not None:
+                    return _replay(entry)
+                response = await view(request, *args, **kwargs)
+                if _is_shareable(request, response):
+                    await _cache().aset(
+                        key, _entry(response), settings.PAGE_CACHE_TTL
+                    )
+                return response
+
+        else:
+
+            @wraps(view)
+            def wrapper(request, *args, **kwargs):
+                if not _is_anonymous(request):
+                    return view(request, *args, **kwargs)
+                key = key_for(request)
+                entry = _cache().get(key)
+                if entry is not None:
+                    return _replay(entry)
+                response = view(request, *args, **kwargs)
+                if _is_shareable(request, response):
+                    _cache().set(
+                        key, _entry(response), settings.PAGE_CACHE_TTL
+                    )
+                return response
+
+        return wrapper
+
+    return decorator
+
+
+def purge() -> None:
+    """Drop every cached page (in this process, for the locmem backend)."""
+    _cache().clear()
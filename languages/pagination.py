@@ -0,0 +1,84 @@
+"""
+Keyset (cursor) pagination for newest-first feeds.
+
+Pages are addressed by the (created_at, id) of the last row shown rather
+than an OFFSET, so page 1000 costs the same as page 1. This matches
+Booking.Meta.ordering and the booking_created_id_idx index.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+
+
+class CursorPage:
+    """One page of rows plus the cursor for the next page (or None)."""
+
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(obj) -> str:
+    """Opaque, URL-safe cursor pointing just past ``obj``."""
+    raw = f"{obj.created_at.isoformat()}|{obj.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Return (created_at, pk) from a cursor, or None if it is malformed."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, pk = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None
+
+
+def _page_queryset(queryset, cursor, per_page):
+    """Rows after ``cursor``, newest first, plus one to detect a next page."""
+    queryset = queryset.order_by("-created_at", "-id")
+    position = decode_cursor(cursor)
+    if position:
+        created_at, pk = position
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at)
+            | Q(created_at=created_at, id__lt=pk)
+        )
+    return queryset[: per_page + 1]
+
+
+def _make_page(rows, per_page) -> CursorPage:
+    items = rows[:per_page]
+    next_cursor = encode_cursor(items[-1]) if len(rows) > per_page else None
+    return CursorPage(items, next_cursor)
+
+
+def paginate_by_cursor(queryset, cursor=None, per_page=20) -> CursorPage:
+    """
+    Return the page of ``queryset`` (newest first) after ``cursor``.
+    A missing or malformed cursor starts from the newest row.
+    """
+    rows = list(_page_queryset(queryset, cursor, per_page))
+    return _make_page(rows, per_page)
+
+
+async def apaginate_by_cursor(queryset, cursor=None, per_page=20):
+    """Async-ORM version of paginate_by_cursor() for async views."""
+    rows = [row async for row in _page_queryset(queryset, cursor, per_page)]
+    return _make_page(rows, per_page)
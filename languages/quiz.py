@@ -0,0 +1,118 @@
+"""Server-side grading of lesson exercises and per-learner option order."""
+
+import hashlib
+import itertools
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import Exercise, ExerciseAttempt, LessonScore
+
+# Every ordering of an exercise's four options, computed once at import
+OPTION_PERMUTATIONS = tuple(itertools.permutations(range(4)))
+_ORDER_KEY = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
+
+
+def _normalize(answer) -> str:
+    return " ".join(str(answer).split()).casefold()
+
+
+def grade_submission(user, lesson_id, answers) -> dict:
+    """
+    Grade a whole lesson's answers in one pass.
+
+    ``answers`` maps exercise id -> given answer; ids outside the lesson
+    are ignored. The answer key is fetched in a single query, attempts
+    are written with one bulk_create and the user's LessonScore is
+    bumped with F() increments instead of re-counting past attempts.
+    Returns None if the lesson has no exercises.
+    """
+    answer_key = {
+        pk: (correct, explanation)
+        for pk, correct, explanation in Exercise.objects.filter(
+            lesson_id=lesson_id
+        ).values_list("id", "correct_answer", "explanation")
+    }
+    if not answer_key:
+        return None
+
+    results, attempts = [], []
+    for exercise_id, given in answers.items():
+        if exercise_id not in answer_key:
+            continue
+        correct_answer, explanation = answer_key[exercise_id]
+        is_correct = _normalize(given) == _normalize(correct_answer)
+        attempts.append(
+            ExerciseAttempt(
+                user=user,
+                exercise_id=exercise_id,
+                answer=str(given)[:255],
+                is_correct=is_correct,
+            )
+        )
+        results.append(
+            {
+                "exercise": exercise_id,
+                "correct": is_correct,
+                "correct_answer": correct_answer,
+                "explanation": explanation,
+            }
+        )
+
+    correct_count = sum(1 for result in results if result["correct"])
+    with transaction.atomic():
+        ExerciseAttempt.objects.bulk_create(attempts)
+        if attempts:
+            _add_to_score(user, lesson_id, len(attempts), correct_count)
+
+    return {
+        "lesson": lesson_id,
+        "answered": len(results),
+        "correct": correct_count,
+        "results": results,
+    }
+
+
+def _add_to_score(user, lesson_id, attempts: int, correct: int) -> None:
+    """Increment the running totals, creating the score row if needed."""
+    scores = LessonScore.objects.filter(user=user, lesson_id=lesson_id)
+    bump = {
+        "attempts": F("attempts") + attempts,
+        "correct": F("correct") + correct,
+    }
+    if scores.update(**bump):
+        return
+    try:
+        with transaction.atomic():
+            LessonScore.objects.create(
+                user=user,
+                lesson_id=lesson_id,
+                attempts=attempts,
+                correct=correct,
+            )
+    except IntegrityError:
+        # A concurrent submission created it first
+        scores.update(**bump)
+
+
+def option_order(user_id, exercise_id) -> tuple:
+    """
+    Stable, per-(user, exercise) permutation of the four options.
+
+    A keyed hash picks one of the precomputed permutations, so the order
+    is the same on every render for the same learner, differs between
+    learners, and needs no random calls or stored state.
+    """
+    digest = hashlib.blake2b(
+        f"{user_id}:{exercise_id}".encode(),
+        key=_ORDER_KEY,
+        digest_size=8,
+    ).digest()
+    index = int.from_bytes(digest, "big") % len(OPTION_PERMUTATIONS)
+    return OPTION_PERMUTATIONS[index]
+
+
+def shuffled_options(options, user_id, exercise_id) -> list:
+    """``options`` (correct answer first) in this learner's order."""
+    return [options[i] for i in option_order(user_id, exercise_id)]
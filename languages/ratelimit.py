@@ -0,0 +1,67 @@
+"""
+Sliding-window rate limiting and duplicate detection for form posts.
+
+Both use the cache alias named by settings.RATELIMIT_CACHE, so the
+backend (local memory, database or file) is chosen in settings.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def _cache():
+    return caches[settings.RATELIMIT_CACHE]
+
+
+def client_ip(request) -> str:
+    """
+    Caller's IP. Behind Heroku's router the real client is the last
+    X-Forwarded-For entry; earlier entries are client-controlled.
+    """
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    if forwarded:
+        return forwarded.split(",")[-1].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def allow(key: str, limit: int, window: int) -> bool:
+    """
+    Count a hit for ``key`` and say whether it is within ``limit`` per
+    ``window`` seconds.
+
+    Uses the sliding-window approximation: the previous fixed window's
+    count, weighted by how much of it still overlaps, plus the current
+    window's count. Two cache reads and one increment per call.
+    """
+    now = time.time()
+    slot = int(now // window)
+    overlap = 1 - (now % window) / window
+    current_key = f"rl:{key}:{slot}"
+    previous_key = f"rl:{key}:{slot - 1}"
+
+    cache = _cache()
+    counts = cache.get_many([current_key, previous_key])
+    used = counts.get(previous_key, 0) * overlap + counts.get(current_key, 0)
+    if used >= limit:
+        return False
+    if not cache.add(current_key, 1, window * 2):
+        try:
+            cache.incr(current_key)
+        except ValueError:  # expired between add() and incr()
+            cache.set(current_key, 1, window * 2)
+    return True
+
+
+def seen_before(*parts, ttl: int) -> bool:
+    """
+    True if the same ``parts`` were submitted within ``ttl`` seconds.
+    The first call records a content hash; repeats find it.
+    """
+    digest = hashlib.sha256(
+        "\x1f".join(" ".join(str(p).split()).casefold() for p in parts)
+        .encode()
+    ).hexdigest()
+    return not _cache().add(f"dup:{digest}", 1, ttl)
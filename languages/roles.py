@@ -0,0 +1,49 @@
+"""Resolve a user's profile role once per request (and briefly in cache)."""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Profile
+
+
+def _cache_key(user_id) -> str:
+    return f"languages:role:{user_id}"
+
+
+def get_role(user) -> str:
+    """
+    Return the user's profile role, creating a student profile if missing.
+
+    The role is memoized on the user object, and request.user lives for
+    exactly one request, so repeat checks are free. Across requests it is
+    kept in the default cache for ROLE_CACHE_TTL seconds and dropped
+    whenever the profile is saved or deleted.
+    """
+    role = getattr(user, "_cached_role", None)
+    if role is not None:
+        return role
+
+    key = _cache_key(user.pk)
+    role = cache.get(key)
+    if role is None:
+        # Only the role column is needed, so skip loading the row
+        role = (
+            Profile.objects.filter(user_id=user.pk)
+            .values_list("role", flat=True)
+            .first()
+        )
+        if role is None:
+            profile, _ = Profile.objects.get_or_create(
+                user=user,
+                defaults={"role": "student"},
+            )
+            role = profile.role
+        cache.set(key, role, settings.ROLE_CACHE_TTL)
+
+    user._cached_role = role
+    return role
+
+
+def forget_role(user_id) -> None:
+    """Evict a user's cached role (called when their profile changes)."""
+    cache.delete(_cache_key(user_id))
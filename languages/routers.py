@@ -0,0 +1,77 @@
+"""
+Primary/replica database routing with read-your-writes pinning.
+
+Writes always go to "default". Reads go to the "replica" database (set
+up from DATABASE_REPLICA_URL) only while a request is being handled,
+and only when that request is safe to serve slightly stale data:
+
+- the request isn't a write (POST, PUT, ...) and wrote nothing so far;
+- the client hasn't written in the last REPLICA_PIN_SECONDS, which
+  ReplicaPinMiddleware tracks with a short-lived cookie;
+- no transaction is open on the primary.
+
+Management commands, the job worker and signal handlers outside a
+request always use the primary.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connections
+
+PRIMARY = "default"
+REPLICA = "replica"
+
+
+@dataclass
+class RequestRouting:
+    """Routing state of the request being handled."""
+
+    pinned: bool = False
+    wrote: bool = False
+
+
+_routing: ContextVar[RequestRouting | None] = ContextVar(
+    "languages_routing", default=None
+)
+
+
+def begin_request(pinned: bool):
+    """Start routing for a request; returns a token for end_request()."""
+    return _routing.set(RequestRouting(pinned=pinned))
+
+
+def end_request(token) -> RequestRouting:
+    """Stop routing for a request and return what it did."""
+    state = _routing.get()
+    _routing.reset(token)
+    return state
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        if (
+            state is None
+            or state.pinned
+            or state.wrote
+            or REPLICA not in settings.DATABASES
+            or connections[PRIMARY].in_atomic_block
+        ):
+            return PRIMARY
+        return REPLICA
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets its schema through replication
+        return db == PRIMARY
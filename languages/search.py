@@ -0,0 +1,144 @@
+"""
+Full-text search over lessons, exercises and courses.
+
+Every searchable object has one SearchDocument row. The text index on
+top of it depends on the database (see migration 0016):
+
+- PostgreSQL: a generated ``search_vector`` tsvector column (title
+  weighted above body) with a GIN index, ranked by ts_rank.
+- SQLite: an external-content FTS5 table kept in sync by triggers,
+  ranked by bm25.
+
+Contact messages get their own index for the admin inbox (migration
+0017): trigram GIN indexes on PostgreSQL, FTS5 on SQLite.
+"""
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+
+from .models import Course, Exercise, Lesson, SearchDocument
+
+FTS_TABLE = "languages_searchdocument_fts"
+CONTACT_FTS_TABLE = "languages_contactmessage_fts"
+# Deepest results page served; ranked search past this is just noise
+MAX_PAGE = 50
+
+
+def _lesson_document(lesson) -> dict:
+    return {
+        "title": lesson.title,
+        "body": f"{lesson.description}\n{lesson.content}",
+        "url": reverse("lesson_detail", args=[lesson.pk]),
+    }
+
+
+def _exercise_document(exercise) -> dict:
+    # Options are left out so search never reveals an answer
+    return {
+        "title": exercise.question[:255],
+        "body": f"{exercise.question}\n{exercise.explanation}",
+        "url": reverse("lesson_detail", args=[exercise.lesson_id])
+        + f"#exercise-{exercise.pk}",
+    }
+
+
+def _course_document(course) -> dict:
+    return {
+        "title": course.title,
+        "body": "",
+        "url": reverse("book_tutor") + f"?course={course.pk}",
+    }
+
+
+BUILDERS = {
+    Lesson: ("lesson", _lesson_document),
+    Exercise: ("exercise", _exercise_document),
+    Course: ("course", _course_document),
+}
+
+
+def index_objects(objs) -> None:
+    """Create or refresh the search documents for ``objs`` in bulk."""
+    docs = []
+    for obj in objs:
+        kind, build = BUILDERS[type(obj)]
+        docs.append(SearchDocument(kind=kind, object_id=obj.pk, **build(obj)))
+    if docs:
+        SearchDocument.objects.bulk_create(
+            docs,
+            update_conflicts=True,
+            unique_fields=["kind", "object_id"],
+            update_fields=["title", "body", "url"],
+        )
+
+
+def unindex_object(obj) -> None:
+    """Remove ``obj`` from the search index."""
+    kind, _ = BUILDERS[type(obj)]
+    SearchDocument.objects.filter(kind=kind, object_id=obj.pk).delete()
+
+
+def fts5_query(query: str) -> str:
+    """Safe FTS5 MATCH expression: all terms, last one as a prefix."""
+    # Quote each term so user input can't inject FTS5 syntax; the last
+    # term also matches as a prefix for search-as-you-type.
+    terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def search(query: str, page: int = 1, per_page: int = 20):
+    """
+    Ranked search results for ``query``.
+    Returns (documents, has_next); each document has a ``rank``.
+    """
+    query = (query or "").strip()
+    if not query:
+        return [], False
+    offset = (min(max(page, 1), MAX_PAGE) - 1) * per_page
+    table = SearchDocument._meta.db_table
+
+    if connection.vendor == "postgresql":
+        sql = (
+            f"SELECT d.*, ts_rank(d.search_vector, q) AS rank "
+            f"FROM {table} d, websearch_to_tsquery('english', %s) q "
+            f"WHERE d.search_vector @@ q "
+            f"ORDER BY rank DESC, d.id LIMIT %s OFFSET %s"
+        )
+        params = [query, per_page + 1, offset]
+    elif connection.vendor == "sqlite":
+        sql = (
+            f"SELECT d.*, -bm25({FTS_TABLE}, 10.0, 1.0) AS rank "
+            f"FROM {FTS_TABLE} f JOIN {table} d ON d.id = f.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s "
+            f"ORDER BY rank DESC, d.id LIMIT %s OFFSET %s"
+        )
+        params = [fts5_query(query), per_page + 1, offset]
+    else:
+        # Unindexed fallback for other backends
+        hits = SearchDocument.objects.filter(title__icontains=query)
+        docs = list(hits.order_by("id")[offset:offset + per_page + 1])
+        for doc in docs:
+            doc.rank = 1.0
+        return docs[:per_page], len(docs) > per_page
+
+    docs = list(SearchDocument.objects.raw(sql, params))
+    return docs[:per_page], len(docs) > per_page
+
+
+def filter_contact_messages(queryset, term: str):
+    """
+    Narrow a ContactMessage queryset to messages matching ``term``
+    through the SQLite FTS5 index. Returns None on other backends, where
+    the trigram indexes already serve the admin's icontains search.
+    """
+    if connection.vendor != "sqlite":
+        return None
+    match = RawSQL(
+        f"SELECT rowid FROM {CONTACT_FTS_TABLE} "
+        f"WHERE {CONTACT_FTS_TABLE} MATCH %s",
+        [fts5_query(term)],
+    )
+    return queryset.filter(pk__in=match)
@@ -0,0 +1,62 @@
+"""Booking service: reserve course seats without overbooking."""
+
+from django.db import IntegrityError, transaction
+
+from .models import Booking, Course
+
+
+class BookingError(Exception):
+    """Base class for bookings the service refuses to save."""
+
+
+class CourseFullError(BookingError):
+    """Raised when a course has no seats left."""
+
+
+class AlreadyBookedError(BookingError):
+    """Raised when the user already holds a booking for the course."""
+
+
+def reserve_seat(booking: Booking) -> Booking:
+    """
+    Save ``booking`` only if its course still has a free seat.
+
+    The course row is locked (SELECT ... FOR UPDATE) until the booking
+    is written, so concurrent requests for the same course queue up
+    while bookings for other courses go ahead in parallel. The seat
+    check reads the course's active_bookings counter, not a COUNT.
+
+    Duplicates are left to the uniq_user_course constraint: the insert
+    is attempted optimistically and a violation becomes
+    AlreadyBookedError, so there is no pre-check query and no race.
+    Raises CourseFullError when the course is at capacity.
+    """
+    with transaction.atomic():
+        course = Course.objects.select_for_update().get(
+            pk=booking.course_id
+        )
+        needs_seat = (
+            booking.seat_course_id == course.pk
+            and booking._held_seat != course.pk
+        )
+        if needs_seat and course.active_bookings >= course.capacity:
+            _raise_if_duplicate(booking)
+            raise CourseFullError(
+                f"Sorry, “{course.title}” is fully booked."
+            )
+        try:
+            with transaction.atomic():
+                booking.save()
+        except IntegrityError:
+            _raise_if_duplicate(booking)
+            raise
+    return booking
+
+
+def _raise_if_duplicate(booking: Booking) -> None:
+    """Failure-path lookup: is this user already booked on the course?"""
+    duplicate = Booking.objects.filter(
+        user_id=booking.user_id, course_id=booking.course_id
+    ).exclude(pk=booking.pk)
+    if duplicate.exists():
+        raise AlreadyBookedError("You already booked this course.")
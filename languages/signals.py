@@ -0,0 +1,91 @@
+"""Signal handlers that keep denormalized data in step with writes."""
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .catalog import bump_catalog_version
+from .dashboard import invalidate_stats
+from .models import Booking, Course, Exercise, Lesson, Profile
+from .roles import forget_role
+from .search import index_objects, unindex_object
+
+
+def _shift_seats(course_id, delta: int) -> None:
+    """Atomically add ``delta`` to a course's active_bookings."""
+    if course_id is None:
+        return
+    Course.objects.filter(pk=course_id).update(
+        active_bookings=F("active_bookings") + delta
+    )
+
+
+@receiver(post_save, sender=Booking)
+def track_seat_on_save(sender, instance, raw, **kwargs):
+    """Move the seat when a booking is created, re-coursed or re-statused."""
+    if raw:
+        return
+    held, now = instance._held_seat, instance.seat_course_id
+    if held != now:
+        _shift_seats(held, -1)
+        _shift_seats(now, +1)
+    instance._held_seat = now
+
+
+@receiver(post_delete, sender=Booking)
+def release_seat_on_delete(sender, instance, **kwargs):
+    """Free the seat held by a deleted booking."""
+    _shift_seats(instance._held_seat, -1)
+    instance._held_seat = None
+
+
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def refresh_dashboard_stats(sender, **kwargs):
+    """Booking and course writes make the dashboard snapshot stale."""
+    invalidate_stats()
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def refresh_cached_role(sender, instance, **kwargs):
+    """A changed or removed profile invalidates the cached role."""
+    forget_role(instance.user_id)
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def refresh_course_catalog(sender, **kwargs):
+    """Course edits change the booking form's course list."""
+    bump_catalog_version()
+
+
+@receiver(post_save, sender=Exercise)
+@receiver(post_delete, sender=Exercise)
+def touch_lesson(sender, instance, raw=False, **kwargs):
+    """Exercise edits change the lesson payload, so bump its version."""
+    if raw:
+        return
+    Lesson.objects.filter(pk=instance.lesson_id).update(
+        updated_at=timezone.now()
+    )
+
+
+@receiver(post_save, sender=Lesson)
+@receiver(post_save, sender=Exercise)
+@receiver(post_save, sender=Course)
+def index_searchable(sender, instance, raw=False, **kwargs):
+    """Keep the search document for this object current."""
+    if not raw:
+        index_objects([instance])
+
+
+@receiver(post_delete, sender=Lesson)
+@receiver(post_delete, sender=Exercise)
+@receiver(post_delete, sender=Course)
+def unindex_searchable(sender, instance, **kwargs):
+    """Drop a deleted object from search results."""
+    unindex_object(instance)
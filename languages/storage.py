@@ -0,0 +1,158 @@
+"""
+Static files storage with a build step in front of WhiteNoise.
+
+During collectstatic, before files are hashed and compressed:
+
+- the project's own CSS and JS (files from STATICFILES_DIRS, not
+  already *.min.*) are minified in place, so the hash and the gzip /
+  Brotli copies are made from the minified bytes;
+- images under STATIC_IMAGE_DIRS get resized variants named
+  ``<name>.<width>w.<format>`` for each of STATIC_IMAGE_WIDTHS below the
+  original width (and the original width itself) in each format of
+  STATIC_IMAGE_FORMATS that Pillow can write. They are hashed like any
+  other file, and the ``responsive_image`` template tag builds
+  ``srcset`` from them.
+
+Pillow is optional: without it images are collected as they are.
+WhiteNoise writes .br files only when the Brotli package is installed.
+"""
+
+import io
+import logging
+import os
+from pathlib import PurePosixPath
+
+import rcssmin
+import rjsmin
+from django.conf import settings
+from django.core.files.base import ContentFile
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+try:
+    from PIL import Image, features
+except ImportError:  # optional: no variants without Pillow
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+MINIFIERS = {
+    ".css": rcssmin.cssmin,
+    ".js": rjsmin.jsmin,
+}
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+def variant_name(name: str, width: int, fmt: str) -> str:
+    """``images/tutor1.jpg`` -> ``images/tutor1.320w.webp``."""
+    path = PurePosixPath(name)
+    return str(path.with_name(f"{path.stem}.{width}w.{fmt}"))
+
+
+def variant_widths(original: int) -> list[int]:
+    """
+    STATIC_IMAGE_WIDTHS narrower than the image, plus the image's own
+    width when it is within range, so srcset can reach full quality.
+    """
+    widths = [w for w in settings.STATIC_IMAGE_WIDTHS if w < original]
+    if original <= max(settings.STATIC_IMAGE_WIDTHS):
+        widths.append(original)
+    return widths
+
+
+def writable_formats() -> list[str]:
+    """STATIC_IMAGE_FORMATS this Pillow build can encode."""
+    if Image is None:
+        return []
+    return [
+        fmt for fmt in settings.STATIC_IMAGE_FORMATS if features.check(fmt)
+    ]
+
+
+class AssetPipelineStorage(CompressedManifestStaticFilesStorage):
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            self._minify(paths)
+            self._make_variants(paths)
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+
+    def _is_project_file(self, storage) -> bool:
+        location = os.path.abspath(getattr(storage, "location", ""))
+        return any(
+            location == os.path.abspath(directory)
+            for directory in settings.STATICFILES_DIRS
+        )
+
+    def _minify(self, paths) -> None:
+        """Minify the collected copies of project CSS/JS in place."""
+        for name, (storage, path) in list(paths.items()):
+            stem, ext = os.path.splitext(name)
+            minify = MINIFIERS.get(ext)
+            if not minify or stem.endswith(".min"):
+                continue
+            if not self._is_project_file(storage):
+                continue
+            with storage.open(path) as source:
+                minified = minify(source.read().decode("utf-8"))
+            self.delete(name)
+            self._save(name, ContentFile(minified.encode("utf-8")))
+            # Hash and compress from the minified copy, not the source
+            paths[name] = (self, name)
+
+    def _make_variants(self, paths) -> None:
+        """Write resized WebP/AVIF copies of project images."""
+        formats = writable_formats()
+        if not formats:
+            return
+        prefixes = tuple(settings.STATIC_IMAGE_DIRS)
+        for name, (storage, path) in list(paths.items()):
+            if not name.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            if not name.startswith(prefixes):
+                continue
+            if not self._is_project_file(storage):
+                continue
+            changed = storage.get_modified_time(path)
+            with storage.open(path) as source:
+                image = Image.open(source)
+                targets = [
+                    (width, fmt, variant_name(name, width, fmt))
+                    for width in variant_widths(image.width)
+                    for fmt in formats
+                ]
+                stale = [
+                    target
+                    for target in targets
+                    if not self._is_fresh(target[2], changed)
+                ]
+                if stale:
+                    # JPEGs can decode at a reduced scale; size it for
+                    # the widest variant we still have to write
+                    widest = max(width for width, _, _ in stale)
+                    image.draft("RGB", (widest, widest))
+                    image.load()
+            for _, _, target in targets:
+                paths[target] = (self, target)
+            if not stale:
+                continue  # unchanged since the last build
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.mode else "RGB")
+            resized = {}
+            for width, fmt, target in stale:
+                if width not in resized:
+                    height = round(image.height * width / image.width)
+                    resized[width] = image.resize(
+                        (width, height), Image.Resampling.LANCZOS
+                    )
+                buffer = io.BytesIO()
+                quality = settings.STATIC_IMAGE_QUALITY[fmt]
+                resized[width].save(buffer, fmt.upper(), quality=quality)
+                self.delete(target)
+                self._save(target, ContentFile(buffer.getvalue()))
+                logger.debug("Wrote %s", target)
+
+    def _is_fresh(self, name, source_changed) -> bool:
+        """True if variant ``name`` was written after its source changed."""
+        return (
+            self.exists(name)
+            and self.get_modified_time(name) >= source_changed
+        )
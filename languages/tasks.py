@@ -0,0 +1,55 @@
+"""Background job handlers (registered with languages.jobs)."""
+
+from datetime import timedelta
+
+from django.core.mail import mail_admins
+from django.utils import timezone
+
+from .jobs import handler
+from .models import ContactMessage
+
+# Identical messages from the same sender within this window are merged
+DEDUP_WINDOW = timedelta(hours=24)
+CONTACT_FIELDS = ("name", "email", "subject", "message")
+
+
+@handler("contact_message")
+def ingest_contact_messages(jobs):
+    """
+    Persist a batch of queued contact submissions.
+
+    Duplicates (same email, subject and message within DEDUP_WINDOW,
+    either in this batch or already stored) are dropped, the rest are
+    written with one bulk_create, and admins get a single summary email.
+    """
+    payloads = [job.payload for job in jobs]
+    emails = {p["email"] for p in payloads}
+    seen = set(
+        ContactMessage.objects.filter(
+            email__in=emails,
+            created_at__gte=timezone.now() - DEDUP_WINDOW,
+        ).values_list("email", "subject", "message")
+    )
+
+    fresh = []
+    for payload in payloads:
+        key = (payload["email"], payload["subject"], payload["message"])
+        if key in seen:
+            continue
+        seen.add(key)
+        fresh.append(
+            ContactMessage(
+                user_id=payload.get("user_id"),
+                **{field: payload[field] for field in CONTACT_FIELDS},
+            )
+        )
+    ContactMessage.objects.bulk_create(fresh)
+
+    if fresh:
+        lines = [f"- {m.name} <{m.email}>: {m.subject}" for m in fresh]
+        # No-op unless settings.ADMINS is configured
+        mail_admins(
+            f"{len(fresh)} new contact message(s)",
+            "\n".join(lines),
+            fail_silently=True,
+        )
@@ -0,0 +1,68 @@
+"""Template tags for static assets built by languages.storage."""
+
+import re
+from functools import lru_cache
+from pathlib import PurePosixPath
+
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+register = template.Library()
+
+
+@lru_cache(maxsize=None)
+def _variants(name: str) -> tuple[tuple[str, str], ...]:
+    """
+    (format, srcset) pairs for the collected variants of ``name``,
+    read once per process from the staticfiles manifest.
+    """
+    path = PurePosixPath(name)
+    pattern = re.compile(
+        re.escape(str(path.with_name(path.stem))) + r"\.(\d+)w\.(\w+)$"
+    )
+    found = {}
+    for collected in getattr(staticfiles_storage, "hashed_files", {}):
+        match = pattern.match(collected)
+        if match:
+            width, fmt = match.groups()
+            found.setdefault(fmt, []).append((int(width), collected))
+    return tuple(
+        (
+            fmt,
+            ", ".join(
+                f"{static(variant)} {width}w"
+                for width, variant in sorted(found[fmt])
+            ),
+        )
+        for fmt in settings.STATIC_IMAGE_FORMATS
+        if fmt in found
+    )
+
+
+@register.simple_tag
+def responsive_image(name, alt="", sizes="100vw", **attrs):
+    """
+    A <picture> for a static image: AVIF/WebP <source>s with a srcset of
+    the collected variants, falling back to the original in <img>.
+
+        {% responsive_image "images/tutor1.jpg" alt="Tutor" sizes="120px" %}
+
+    Other keyword arguments (class="img-thumbnail") become <img> attributes.
+
+    Without collected variants (e.g. no Pillow) it is just the <img>.
+    """
+    return format_html(
+        '<picture>{}<img src="{}" alt="{}"{}></picture>',
+        format_html_join(
+            "",
+            '<source type="image/{}" srcset="{}" sizes="{}">',
+            ((fmt, srcset, sizes) for fmt, srcset in _variants(name)),
+        ),
+        static(name),
+        alt,
+        flatatt(attrs),
+    )
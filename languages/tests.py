@@ -0,0 +1,100 @@
+import threading
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from .models import Booking, Course
+from .services import AlreadyBookedError, CourseFullError, reserve_seat
+
+
+class ConcurrentBookingTests(TransactionTestCase):
+    """
+    The invariants of manage.py stress_bookings, as tests: many threads
+    book at once, each on its own database connection, through the
+    booking service.
+    """
+
+    THREADS = 20
+
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("needs a file test database (see settings)")
+        today = timezone.now().date()
+        self.course = Course.objects.create(
+            title="Concurrency",
+            capacity=5,
+            start_date=today,
+            end_date=today + timedelta(days=30),
+        )
+        self.User = get_user_model()
+
+    def book_concurrently(self, users) -> dict:
+        barrier = threading.Barrier(len(users))
+        lock = threading.Lock()
+        results = {"booked": 0, "full": 0, "duplicate": 0, "errors": []}
+
+        def book(user):
+            try:
+                barrier.wait()
+                reserve_seat(
+                    Booking(
+                        user=user,
+                        course_id=self.course.pk,
+                        name=user.username,
+                        email=f"{user.username}@example.com",
+                    )
+                )
+                outcome = "booked"
+            except CourseFullError:
+                outcome = "full"
+            except AlreadyBookedError:
+                outcome = "duplicate"
+            except Exception as exc:
+                with lock:
+                    results["errors"].append(repr(exc))
+                return
+            finally:
+                connection.close()
+            with lock:
+                results[outcome] += 1
+
+        workers = [
+            threading.Thread(target=book, args=(user,)) for user in users
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return results
+
+    def assertStored(self, expected):
+        stored = self.course.bookings.filter(
+            status__in=Booking.ACTIVE_STATUSES
+        ).count()
+        self.course.refresh_from_db()
+        self.assertEqual(stored, expected)
+        self.assertEqual(self.course.active_bookings, stored)
+
+    def test_capacity_is_never_exceeded(self):
+        users = [
+            self.User.objects.create(username=f"student-{i}")
+            for i in range(self.THREADS)
+        ]
+        results = self.book_concurrently(users)
+        self.assertEqual(results["errors"], [])
+        self.assertEqual(results["booked"], self.course.capacity)
+        self.assertEqual(
+            results["full"], self.THREADS - self.course.capacity
+        )
+        self.assertStored(self.course.capacity)
+
+    def test_same_user_books_once(self):
+        user = self.User.objects.create(username="student")
+        results = self.book_concurrently([user] * self.THREADS)
+        self.assertEqual(results["errors"], [])
+        self.assertEqual(results["booked"], 1)
+        self.assertEqual(results["duplicate"], self.THREADS - 1)
+        self.assertStored(1)
@@ -7,6 +7,22 @@ urlpatterns = [
     path("english/", views.english, name="english"),
     path("contact/", views.contact_us, name="contact_us"),
 
+    # Lessons API
+    path("lessons/", views.lesson_list, name="lesson_list"),
+    path(
+        "lessons/<int:lesson_id>/",
+        views.lesson_detail,
+        name="lesson_detail",
+    ),
+    path(
+        "lessons/<int:lesson_id>/submit/",
+        views.submit_lesson_answers,
+        name="submit_lesson_answers",
+    ),
+
+    # Search
+    path("search/", views.search_view, name="search"),
+
     # Booking
     path("book/", views.book_tutor, name="book_tutor"),
     path("book/", views.book_tutor, name="booking"),  # alias
@@ -43,6 +59,18 @@ urlpatterns = [
         name="student_dashboard",
     ),
 
+    # Streaming exports (admin only)
+    path(
+        "exports/bookings/",
+        views.export_bookings,
+        name="export_bookings",
+    ),
+    path(
+        "exports/contact-messages/",
+        views.export_contact_messages,
+        name="export_contact_messages",
+    ),
+
     # Password reset placeholder
     path(
         "account/password/reset/",
@@ -1,44 +1,227 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth.decorators import (
     login_required,
     user_passes_test,
 )
-from django.utils import timezone
-from django.db.models import Count, Q
-from django.views.decorators.http import require_http_methods
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import (
+    require_http_methods,
+    require_POST,
+)
 
 from .models import (
     Booking,
-    Course,
-    Profile,
-    ContactMessage,  # noqa: F401 (used via ContactForm save)
+    ContactMessage,
+)
+from .catalog import get_courses
+from .dashboard import get_stats
+from .exports import (
+    BOOKING_EXPORT_FIELDS,
+    CONTACT_EXPORT_FIELDS,
+    export_response,
 )
 from .forms import BookingForm, ContactForm
+from .jobs import enqueue
+from .lessons import (
+    catalog_version,
+    get_lesson_payload,
+    lesson_list_payload,
+    lesson_version,
+    personalize_lesson,
+)
+from .pagecache import cache_public_page
+from .pagination import apaginate_by_cursor, paginate_by_cursor
+from .quiz import grade_submission
+from .ratelimit import allow, client_ip, seen_before
+from .roles import get_role
+from .search import MAX_PAGE, search
+from .services import AlreadyBookedError, CourseFullError, reserve_seat
+
+
+async def _arender(request, template_name, context=None, status=None):
+    """
+    render() for async views. Templates may lazily touch the session or
+    the DB (user, messages), so rendering runs in Django's sync thread.
+    """
+    return await sync_to_async(render)(
+        request, template_name, context, status=status
+    )
 
 
 # -----------------------------
 # Home & simple content pages
 # -----------------------------
-def home(request):
+@cache_public_page("home")
+async def home(request):
     """Public home page."""
-    return render(request, "home.html")
+    return await _arender(request, "home.html")
 
 
-def english(request):
+@cache_public_page("english")
+async def english(request):
     """
     English learning page.
     Add @login_required if you want to restrict to logged-in users only.
     """
-    return render(request, "english.html")
+    return await _arender(request, "english.html")
+
+
+@cache_public_page("404", per_path=False)
+def page_not_found(request, exception):
+    """handler404: the 404 page, identical for every anonymous visitor."""
+    return render(request, "404.html", status=404)
+
+
+# -----------------------------
+# Lessons API (async JSON, HTTP-cacheable)
+# -----------------------------
+def _not_modified(request, etag, last_modified):
+    """304 (or 412) response if the client's validators match, else None."""
+    if last_modified:
+        last_modified = int(last_modified.timestamp())
+    return get_conditional_response(
+        request,
+        etag=quote_etag(etag),
+        last_modified=last_modified,
+    )
+
+
+def _add_validators(response, etag, last_modified):
+    response.headers.setdefault("ETag", quote_etag(etag))
+    if last_modified:
+        response.headers.setdefault(
+            "Last-Modified", http_date(last_modified.timestamp())
+        )
+    return response
+
+
+async def lesson_list(request):
+    """All lessons with exercise counts; 304 when nothing changed."""
+    total, newest = await catalog_version()
+    etag = f"{total}-{newest.timestamp() if newest else 0}"
+    response = _not_modified(request, etag, newest)
+    if response is None:
+        response = JsonResponse({"lessons": await lesson_list_payload()})
+    return _add_validators(response, etag, newest)
+
+
+async def lesson_detail(request, lesson_id):
+    """One lesson with its exercises; 304 when nothing changed."""
+    version = await lesson_version(lesson_id)
+    if version is None:
+        raise Http404("Lesson not found.")
+    user = await request.auser()
+    # Option order is per learner, so the validator is too
+    etag = f"{lesson_id}-{version.timestamp()}-{user.pk or 0}"
+    response = _not_modified(request, etag, version)
+    if response is None:
+        payload = await get_lesson_payload(lesson_id, version)
+        response = JsonResponse(personalize_lesson(payload, user.pk or 0))
+    return _add_validators(response, etag, version)
+
+
+@login_required
+@require_POST
+def submit_lesson_answers(request, lesson_id):
+    """
+    Grade all answers for a lesson in one request.
+    Accepts JSON {"answers": {"<exercise id>": "answer"}} or form fields
+    named answer_<exercise id>.
+    """
+    if request.content_type == "application/json":
+        try:
+            raw = json.loads(request.body or b"{}").get("answers", {})
+        except (ValueError, AttributeError):
+            return JsonResponse({"error": "Invalid JSON."}, status=400)
+    else:
+        raw = {
+            key.removeprefix("answer_"): value
+            for key, value in request.POST.items()
+            if key.startswith("answer_")
+        }
+    if not isinstance(raw, dict):
+        return JsonResponse({"error": "Invalid answers."}, status=400)
+
+    answers = {}
+    for key, value in raw.items():
+        try:
+            answers[int(key)] = value
+        except (TypeError, ValueError):
+            continue
+
+    graded = grade_submission(request.user, lesson_id, answers)
+    if graded is None:
+        raise Http404("Lesson not found.")
+    return JsonResponse(graded)
+
+
+# -----------------------------
+# Search (JSON)
+# -----------------------------
+def search_view(request):
+    """Ranked full-text search: ?q=<terms>&page=<n>."""
+    query = request.GET.get("q", "")
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        page = 1
+    page = min(max(page, 1), MAX_PAGE)
+    documents, has_next = search(query, page=page)
+    has_next = has_next and page < MAX_PAGE
+    return JsonResponse(
+        {
+            "query": query,
+            "page": page,
+            "has_next": has_next,
+            "results": [
+                {
+                    "kind": doc.kind,
+                    "id": doc.object_id,
+                    "title": doc.title,
+                    "url": doc.url,
+                    "rank": round(float(doc.rank), 4),
+                }
+                for doc in documents
+            ],
+        }
+    )
+
+
+def _contact_rate_ok(request, ip) -> bool:
+    """Per-IP and, when logged in, per-user contact post limits."""
+    limit = settings.CONTACT_RATE_LIMIT
+    window = settings.CONTACT_RATE_WINDOW
+    if not allow(f"contact:ip:{ip}", limit, window):
+        return False
+    if request.user.is_authenticated:
+        return allow(f"contact:user:{request.user.pk}", limit, window)
+    return True
 
 
 def contact_us(request):
     """
-    Show the contact form, save submissions to ContactMessage,
-    and give user feedback. Admins can view messages in /admin/.
+    Show the contact form, queue submissions for the background worker
+    (which stores them as ContactMessage), and give user feedback.
+    Admins can view messages in /admin/.
     """
     if request.method == "POST":
+        ip = client_ip(request)
+        if not _contact_rate_ok(request, ip):
+            messages.error(
+                request,
+                "Too many messages. Please wait a few minutes and retry.",
+            )
+            form = ContactForm(request.POST)
+            return render(
+                request, "contact_us.html", {"form": form}, status=429
+            )
         form = ContactForm(request.POST)
         if form.is_valid():
             msg = form.save(commit=False)
@@ -52,7 +235,27 @@ def contact_us(request):
                     )
                 if not msg.email:
                     msg.email = request.user.email or msg.email
-            msg.save()
+            duplicate = seen_before(
+                ip,
+                request.user.pk,
+                msg.email,
+                msg.subject,
+                msg.message,
+                ttl=settings.CONTACT_DEDUP_TTL,
+            )
+            # One INSERT into the job queue; see tasks.py for the rest.
+            # A resubmitted message is merged: same feedback, no write.
+            if not duplicate:
+                enqueue(
+                    "contact_message",
+                    {
+                        "user_id": msg.user_id,
+                        "name": msg.name,
+                        "email": msg.email,
+                        "subject": msg.subject,
+                        "message": msg.message,
+                    },
+                )
             messages.success(
                 request,
                 (
@@ -81,18 +284,6 @@ def contact_us(request):
 # -----------------------------
 # Profile helpers
 # -----------------------------
-def _ensure_profile(user) -> Profile:
-    """
-    Ensure the user has a Profile.
-    If missing, create one with the default role 'student'.
-    """
-    profile, _ = Profile.objects.get_or_create(
-        user=user,
-        defaults={"role": "student"},
-    )
-    return profile
-
-
 def is_admin(user):
     """
     Check if a user is an admin:
@@ -104,7 +295,7 @@ def is_admin(user):
     if user.is_staff or user.is_superuser:
         return True
     try:
-        return _ensure_profile(user).role == "admin"
+        return get_role(user) == "admin"
     except Exception:
         return False
 
@@ -115,7 +306,7 @@ def login_redirect_by_role(user) -> str:
     - Admin → admin dashboard
     - Others → home
     """
-    _ensure_profile(user)  # ensure profile exists
+    get_role(user)  # ensure profile exists (memoized for is_admin)
     return "admin_dashboard" if is_admin(user) else "home"
 
 
@@ -125,7 +316,8 @@ def login_redirect_by_role(user) -> str:
 @login_required
 def post_login_redirect(request):
     """Redirect user after login based on their role."""
-    list(messages.get_messages(request))  # clear any messages
+    # Drop pending messages (e.g. allauth's "signed in") unread
+    messages.get_messages(request).used = True
     return redirect(login_redirect_by_role(request.user))
 
 
@@ -142,68 +334,58 @@ def admin_dashboard(request):
     - Previous bookings
     - Stats
     """
-    today = timezone.now().date()
-
-    # Courses that have any booking (all time)
-    booked_course_ids = (
-        Booking.objects.values_list("course_id", flat=True).distinct()
+    # Aggregates come from a cached snapshot (see languages.dashboard)
+    stats = get_stats()
+    today = stats["today"]
+
+    # Bookings newest first, 50 at a time ("load more" passes ?cursor=)
+    previous_bookings = paginate_by_cursor(
+        Booking.objects.select_related("course", "user"),
+        cursor=request.GET.get("cursor"),
+        per_page=50,
     )
 
-    # Active = has bookings OR is within date range
-    active_filters = (
-        Q(id__in=booked_course_ids)
-        | Q(start_date__lte=today, end_date__gte=today)
-    )
-
-    # Active courses with booking counts
-    active_courses = (
-        Course.objects.filter(active_filters)
-        .annotate(total_bookings=Count("bookings"))
-        .distinct()
-        .order_by("title")
-    )
-
-    # All-time booked courses with counts
-    booked_courses = (
-        Course.objects.filter(id__in=booked_course_ids)
-        .annotate(total_bookings=Count("bookings"))
-        .order_by("-id")
-    )
-
-    # Last 50 bookings (prefer created_at)
-    try:
-        previous_bookings = (
-            Booking.objects.select_related("course", "user")
-            .order_by("-created_at")[:50]
-        )
-    except Exception:
-        previous_bookings = (
-            Booking.objects.select_related("course", "user")
-            .order_by("-id")[:50]
-        )
-
-    # Overview stats
-    total_courses = Course.objects.count()
-    total_bookings = Booking.objects.count()
-    try:
-        upcoming_bookings = Booking.objects.filter(
-            date__gte=today
-        ).count()
-    except Exception:
-        upcoming_bookings = None
-
     context = {
         "today": today,
-        "active_courses": active_courses,
-        "booked_courses": booked_courses,
+        "active_courses": stats["active_courses"],
+        "booked_courses": stats["booked_courses"],
         "previous_bookings": previous_bookings,
-        "total_courses": total_courses,
-        "total_bookings": total_bookings,
-        "upcoming_bookings": upcoming_bookings,
+        "next_cursor": previous_bookings.next_cursor,
+        "is_first_page": not request.GET.get("cursor"),
+        "total_courses": stats["total_courses"],
+        "total_bookings": stats["total_bookings"],
+        "upcoming_bookings": stats["upcoming_bookings"],
     }
     return render(request, "admin_dashboard.html", context)
 
 
+# -----------------------------
+# Exports (admin only, streamed)
+# -----------------------------
+@login_required
+@user_passes_test(is_admin, login_url="home")
+def export_bookings(request):
+    """Download all bookings as CSV (default) or ?format=jsonl."""
+    return export_response(
+        Booking.objects.order_by("id"),
+        BOOKING_EXPORT_FIELDS,
+        "bookings",
+        fmt=request.GET.get("format", "csv"),
+    )
+
+
+@login_required
+@user_passes_test(is_admin, login_url="home")
+def export_contact_messages(request):
+    """Download all contact messages as CSV (default) or ?format=jsonl."""
+    return export_response(
+        ContactMessage.objects.order_by("id"),
+        CONTACT_EXPORT_FIELDS,
+        "contact-messages",
+        fmt=request.GET.get("format", "csv"),
+    )
+
+
 # -----------------------------
 # Booking: create/list/edit/delete
 # -----------------------------
@@ -222,7 +404,7 @@ def book_tutor(request):
         if not email_value:
             form.add_error("email", "This field is required.")
             messages.error(request, "Please correct the errors below.")
-            courses = Course.objects.all().order_by("title")
+            courses = sorted(get_courses(), key=lambda c: c["title"])
             return render(
                 request,
                 "booking.html",
@@ -233,12 +415,18 @@ def book_tutor(request):
         if form.is_valid():
             booking = form.save(commit=False)
             booking.user = request.user
-            booking.save()
-            messages.success(
-                request,
-                "🎉 Booking submitted successfully!",
-            )
-            return redirect("my_bookings")
+            try:
+                reserve_seat(booking)
+            except CourseFullError as exc:
+                form.add_error("course", str(exc))
+            except AlreadyBookedError as exc:
+                form.add_error(None, str(exc))
+            else:
+                messages.success(
+                    request,
+                    "🎉 Booking submitted successfully!",
+                )
+                return redirect("my_bookings")
 
         messages.error(request, "Please correct the errors below.")
     else:
@@ -252,7 +440,7 @@ def book_tutor(request):
                 initial["email"] = request.user.email
         form = BookingForm(user=request.user, initial=initial)
 
-    courses = Course.objects.all().order_by("title")
+    courses = sorted(get_courses(), key=lambda c: c["title"])
     return render(request, "booking.html", {"form": form, "courses": courses})
 
 
@@ -263,14 +451,20 @@ def get_tutor(request):
 
 
 @login_required
-def my_bookings_view(request):
-    """Show user's bookings."""
-    bookings = (
-        Booking.objects.filter(user=request.user)
-        .select_related("course")
-        .order_by("-created_at", "-id")
+async def my_bookings_view(request):
+    """Show user's bookings, newest first, a page at a time."""
+    user = await request.auser()
+    bookings = await apaginate_by_cursor(
+        Booking.objects.filter(user=user).select_related("course"),
+        cursor=request.GET.get("cursor"),
+        per_page=20,
     )
-    return render(request, "my_bookings.html", {"bookings": bookings})
+    context = {
+        "bookings": bookings,
+        "next_cursor": bookings.next_cursor,
+        "is_first_page": not request.GET.get("cursor"),
+    }
+    return await _arender(request, "my_bookings.html", context)
 
 
 @login_required
@@ -282,9 +476,19 @@ def edit_booking_view(request, booking_id):
             request.POST, instance=booking, user=request.user
         )
         if form.is_valid():
-            form.save()
-            messages.success(request, "Booking updated.")
-            return redirect("my_bookings")
+            try:
+                if "course" in form.changed_data:
+                    # Moving to another course needs a free seat there
+                    reserve_seat(form.save(commit=False))
+                else:
+                    form.save()
+            except CourseFullError as exc:
+                form.add_error("course", str(exc))
+            except AlreadyBookedError as exc:
+                form.add_error(None, str(exc))
+            else:
+                messages.success(request, "Booking updated.")
+                return redirect("my_bookings")
         messages.error(request, "Please fix the errors below.")
     else:
         form = BookingForm(instance=booking, user=request.user)
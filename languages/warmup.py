@@ -0,0 +1,51 @@
+"""
+Pre-compile templates into the cached template loader.
+
+The cached loader parses a template the first time it is requested and
+keeps the compiled version for the life of the process. warm_templates()
+requests every project template up front, so the first page a freshly
+booted worker serves doesn't pay the parse cost. It runs from
+LanguagesConfig.ready when settings.TEMPLATE_WARMUP is on, and from
+``manage.py warm_templates``.
+"""
+
+import logging
+from pathlib import Path
+
+from django.template import TemplateSyntaxError, engines
+
+logger = logging.getLogger(__name__)
+
+
+def project_templates(engine) -> list[str]:
+    """Names of the templates under the engine's DIRS, sorted."""
+    names = set()
+    for directory in engine.engine.dirs:
+        root = Path(directory)
+        names.update(
+            path.relative_to(root).as_posix()
+            for path in root.rglob("*.html")
+        )
+    return sorted(names)
+
+
+def warm_templates() -> tuple[int, list[str]]:
+    """
+    Compile every project template in every Django template engine.
+
+    Returns (compiled count, names that failed). Failures are logged,
+    not raised, so a broken template can't stop a worker from booting.
+    """
+    compiled, failed = 0, []
+    for engine in engines.all():
+        if not hasattr(engine, "engine"):
+            continue  # not a DjangoTemplates backend
+        for name in project_templates(engine):
+            try:
+                engine.get_template(name)
+            except TemplateSyntaxError:
+                logger.exception("Template warmup failed for %s", name)
+                failed.append(name)
+            else:
+                compiled += 1
+    return compiled, failed
@@ -3,6 +3,11 @@ ASGI config for learnlang project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Production serves WSGI (the Procfile "web" process). The "asgi"
+process runs this application under uvicorn workers as an opt-in
+profile. Under ASGI, Django buffers sync streaming responses (CSV
+exports, WhiteNoise files) in memory before sending them.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
@@ -8,6 +8,7 @@ import os
 import sys
 from dotenv import load_dotenv
 import dj_database_url
+from whitenoise.compress import Compressor
 
 # -----------------------------------------------------------------------------
 # Load .env early if present (local dev)
@@ -88,6 +89,8 @@ AUTHENTICATION_BACKENDS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Outside sessions so session reads/writes are routed with the request
+    "languages.middleware.ReplicaPinMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -103,8 +106,19 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [TEMPLATES_DIR],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Parse each template once per process. Explicit so the
+            # warmup in languages.warmup has a cache to fill; in DEBUG
+            # the autoreloader resets it when a template changes.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -120,21 +134,170 @@ WSGI_APPLICATION = "learnlang.wsgi.application"
 # -----------------------------------------------------------------------------
 # Database (SQLite for dev; Postgres in prod via DATABASE_URL)
 # -----------------------------------------------------------------------------
+# DB_POOL=true hands connections out from a psycopg 3 pool shared by
+# the threads of a worker process (Postgres only); Django requires
+# CONN_MAX_AGE=0 then. Otherwise each thread keeps one persistent
+# connection for DB_CONN_MAX_AGE seconds. Either way connections are
+# health-checked before reuse, so a DB restart doesn't surface as errors.
+DB_POOL = str(os.getenv("DB_POOL", "False")).lower() == "true"
+
+# Take SQLite's write lock up front so concurrent bookings queue instead
+# of failing with "database is locked".
+SQLITE_OPTIONS = {"transaction_mode": "IMMEDIATE", "timeout": 20}
+
+
+def _database_from_url(url: str) -> dict:
+    """A DATABASES entry for ``url`` with the pooling settings above."""
+    database = dj_database_url.parse(
+        url,
+        conn_max_age=(
+            0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "600"))
+        ),
+        conn_health_checks=True,
+        ssl_require=not DEBUG,
+    )
+    if database["ENGINE"] == "django.db.backends.sqlite3":
+        # No pool or sslmode for a file database
+        database["OPTIONS"] = dict(SQLITE_OPTIONS)
+        return database
+    if DB_POOL:
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            # Seconds a request waits for a free connection
+            "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        }
+    return database
+
+
 if os.getenv("DATABASE_URL"):
-    DATABASES = {
-        "default": dj_database_url.config(
-            conn_max_age=600,
-            ssl_require=not DEBUG,
-        )
-    }
+    DATABASES = {"default": _database_from_url(os.environ["DATABASE_URL"])}
 else:
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            "OPTIONS": dict(SQLITE_OPTIONS),
+            # A file, not :memory:, so the concurrent booking tests can
+            # open a connection per thread
+            "TEST": {"NAME": BASE_DIR / "test_db.sqlite3"},
         }
     }
 
+# Optional read replica. Reads made while handling a request go there
+# (languages/routers.py) unless the request writes or the client wrote
+# within the last REPLICA_PIN_SECONDS; everything else uses "default".
+if os.getenv("DATABASE_REPLICA_URL"):
+    DATABASES["replica"] = _database_from_url(
+        os.environ["DATABASE_REPLICA_URL"]
+    )
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+DATABASE_ROUTERS = ["languages.routers.PrimaryReplicaRouter"]
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "15"))
+
+# -----------------------------------------------------------------------------
+# Cache
+# -----------------------------------------------------------------------------
+# The default cache holds the dashboard snapshot, course catalog, roles
+# and lesson payloads. Writes invalidate them through signals, and that
+# only reaches processes that share the backend:
+#   "file"   (default) every worker on one host/dyno
+#   "db"     every process, incl. one-off `heroku run` commands
+#            (run `python manage.py createcachetable` once)
+#   "locmem" this process only; other workers keep stale entries
+#            until their TTL runs out
+_DEFAULT_CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "learnlang-default",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "CACHE_DIR", str(BASE_DIR / ".cache" / "default")
+        ),
+    },
+    "db": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "learnlang_cache",
+    },
+}
+CACHES = {
+    "default": _DEFAULT_CACHE_BACKENDS[os.getenv("CACHE_BACKEND", "file")],
+}
+
+# Rate-limit / duplicate-submission counters: "locmem" (per process),
+# "file" (shared by workers on one host) or "db" (shared everywhere;
+# run `python manage.py createcachetable` once).
+_RATELIMIT_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "learnlang-ratelimit",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "RATELIMIT_CACHE_DIR", str(BASE_DIR / ".cache" / "ratelimit")
+        ),
+    },
+    "db": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "learnlang_cache",
+    },
+}
+CACHES["ratelimit"] = _RATELIMIT_BACKENDS[
+    os.getenv("RATELIMIT_BACKEND", "locmem")
+]
+RATELIMIT_CACHE = "ratelimit"
+
+# Full-page cache for anonymous visitors (languages.pagecache). "file"
+# shares pages between workers and lets purge_page_cache reach them all.
+_PAGE_CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "learnlang-pages",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "PAGE_CACHE_DIR", str(BASE_DIR / ".cache" / "pages")
+        ),
+    },
+}
+CACHES["pages"] = _PAGE_CACHE_BACKENDS[
+    os.getenv("PAGE_CACHE_BACKEND", "locmem")
+]
+PAGE_CACHE = "pages"
+PAGE_CACHE_TTL = int(os.getenv("PAGE_CACHE_TTL", "600"))
+
+# Contact form: at most CONTACT_RATE_LIMIT posts per CONTACT_RATE_WINDOW
+# seconds per IP (and per user), identical messages merged for
+# CONTACT_DEDUP_TTL seconds.
+CONTACT_RATE_LIMIT = int(os.getenv("CONTACT_RATE_LIMIT", "5"))
+CONTACT_RATE_WINDOW = int(os.getenv("CONTACT_RATE_WINDOW", "600"))
+CONTACT_DEDUP_TTL = int(os.getenv("CONTACT_DEDUP_TTL", "3600"))
+
+# Seconds the admin dashboard aggregates may be served from cache.
+# Writes invalidate it sooner in every process sharing CACHE_BACKEND;
+# with "locmem", other workers catch up within this window.
+DASHBOARD_STATS_TTL = int(os.getenv("DASHBOARD_STATS_TTL", "60"))
+
+# Seconds a user's profile role may be reused across requests.
+ROLE_CACHE_TTL = int(os.getenv("ROLE_CACHE_TTL", "60"))
+
+# Seconds the course catalog (booking form choices) may be cached.
+# Course saves/deletes invalidate it immediately wherever CACHE_BACKEND
+# is shared (see above); with "locmem", only in the writing process.
+COURSE_CATALOG_TTL = int(os.getenv("COURSE_CATALOG_TTL", "300"))
+
+# Compile every project template when the app loads, so a new worker's
+# first request skips the parse. Turn on for web processes.
+TEMPLATE_WARMUP = str(os.getenv("TEMPLATE_WARMUP", "False")).lower() == "true"
+
+# Seconds a rendered lesson payload stays cached. Keys include the
+# lesson's updated_at, so edits never serve stale content.
+LESSON_CACHE_TTL = int(os.getenv("LESSON_CACHE_TTL", "3600"))
+
 # -----------------------------------------------------------------------------
 # Password validation
 # -----------------------------------------------------------------------------
@@ -177,17 +340,39 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 STATIC_DIR = BASE_DIR / "static"
 STATICFILES_DIRS = [STATIC_DIR] if STATIC_DIR.exists() else []
 
+# What collectstatic (and WhiteNoise) take from STATICFILES_DIRS; see
+# languages/finders.py. Documentation screenshots stay out of deploys.
+STATICFILES_FINDERS = [
+    "languages.finders.RuntimeAssetsFinder",
+    "django.contrib.staticfiles.finders.AppDirectoriesFinder",
+]
+STATICFILES_EXCLUDE = ["documentation", "*.lnk"]
+STATICFILES_INCLUDE = []
+
 STORAGES = {
     "default": {
         "BACKEND": "django.core.files.storage.FileSystemStorage",
     },
     "staticfiles": {
-        "BACKEND": (
-            "whitenoise.storage.CompressedManifestStaticFilesStorage"
-        ),
+        # WhiteNoise's compressed manifest storage plus minification and
+        # responsive image variants (languages/storage.py)
+        "BACKEND": "languages.storage.AssetPipelineStorage",
     },
 }
 
+# Resized variants written by collectstatic for images under these
+# directories, used by the {% responsive_image %} tag's srcset.
+STATIC_IMAGE_DIRS = ["images/"]
+STATIC_IMAGE_WIDTHS = [160, 320, 640, 1280]
+STATIC_IMAGE_FORMATS = ["avif", "webp"]
+# Encoder quality per format; AVIF's scale runs lower for the same look.
+STATIC_IMAGE_QUALITY = {"avif": 55, "webp": 80}
+# Already-compressed formats WhiteNoise shouldn't gzip/Brotli again
+WHITENOISE_SKIP_COMPRESS_EXTENSIONS = [
+    *Compressor.SKIP_COMPRESS_EXTENSIONS,
+    "avif",
+]
+
 # -----------------------------------------------------------------------------
 # Auth / allauth
 # -----------------------------------------------------------------------------
@@ -226,12 +411,51 @@ else:
     CSRF_COOKIE_SECURE = False
 
 # -----------------------------------------------------------------------------
-# Messages / Logging
+# Messages / Sessions / Logging
 # -----------------------------------------------------------------------------
+# Flash messages ride in a signed cookie and only fall back to the
+# session when they don't fit, so flashing one costs no session write.
 MESSAGE_STORAGE = (
-    "django.contrib.messages.storage.session.SessionStorage"
+    "django.contrib.messages.storage.fallback.FallbackStorage"
 )
 
+# SESSION_BACKEND picks where sessions live:
+#   "db"             one session-table read per request with a session,
+#                    a write whenever it changes (Django's default)
+#   "cached_db"      reads served from the "sessions" cache, writes go
+#                    to both. Needs a cache every web process shares,
+#                    else a worker can serve a stale session after a
+#                    logout: SESSION_CACHE_BACKEND=file (one host) or db.
+#   "signed_cookies" no server-side storage and no queries; the data
+#                    (JSON, signed with SECRET_KEY) lives in the cookie
+#                    and stays valid until it expires, even after logout.
+_SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+SESSION_ENGINE = _SESSION_ENGINES[os.getenv("SESSION_BACKEND", "db")]
+_SESSION_CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "learnlang-sessions",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "SESSION_CACHE_DIR", str(BASE_DIR / ".cache" / "sessions")
+        ),
+    },
+    "db": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "learnlang_cache",
+    },
+}
+CACHES["sessions"] = _SESSION_CACHE_BACKENDS[
+    os.getenv("SESSION_CACHE_BACKEND", "file")
+]
+SESSION_CACHE_ALIAS = "sessions"
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -25,3 +25,5 @@ urlpatterns = [
     # App routes: home, english, booking, dashboards, etc
     path("", include("languages.urls")),
 ]
+
+handler404 = "languages.views.page_not_found"